@@ -1,4 +1,5 @@
 """Google Gemini provider for image generation."""
+import traceback
 import uuid
 from typing import Optional
 from pathlib import Path
@@ -135,7 +136,6 @@ CRITICAL REQUIREMENTS:
             
         except Exception as e:
             print(f"[Gemini Image] Error: {e}")
-            import traceback
             traceback.print_exc()
         
         return ""
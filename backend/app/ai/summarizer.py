@@ -28,8 +28,13 @@ class Summarizer:
         self,
         paper: Paper,
         style: str = "newsletter",
+        domain_config: Optional[DomainConfig] = None,
     ) -> PaperSummary:
-        """Generate summary for a paper."""
+        """Generate summary for a paper.
+
+        ``domain_config`` overrides the one given at construction, so one
+        summarizer can serve any domain.
+        """
 
         style_instructions = self._get_style_instructions(style)
 
@@ -37,14 +42,14 @@ class Summarizer:
         ai_role = "science communicator"
         content_focus = "scientific research"
         item_term = "paper"
-        if self.domain_config:
-            ai_role = self.domain_config.ai_role
-            content_focus = self.domain_config.content_focus
-            item_term = self.domain_config.item_terminology
+        domain_config = domain_config or self.domain_config
+        if domain_config:
+            ai_role = domain_config.ai_role
+            content_focus = domain_config.content_focus
+            item_term = domain_config.item_terminology
 
-        # Handle authors - could be list or set
-        authors_list = list(paper.authors) if paper.authors else []
-        authors_str = ", ".join(a.name for a in authors_list[:5]) if authors_list else "Unknown"
+        authors_list = paper.authors or []
+        authors_str = ", ".join(a["name"] for a in authors_list[:5]) if authors_list else "Unknown"
 
         prompt = f"""Summarize this {item_term} for a newsletter audience focused on {content_focus}.
 
@@ -197,6 +202,7 @@ Focus on practical implications for daily life and wellness.""",
         self,
         papers: List[Paper],
         digest_name: str,
+        domain_config: Optional[DomainConfig] = None,
     ) -> tuple[str, str, str]:
         """Generate intro, connecting narrative, and conclusion for a digest."""
 
@@ -204,10 +210,11 @@ Focus on practical implications for daily life and wellness.""",
         ai_role = "science communicator"
         content_focus = "scientific research"
         item_term_plural = "papers"
-        if self.domain_config:
-            ai_role = self.domain_config.ai_role
-            content_focus = self.domain_config.content_focus
-            item_term_plural = self.domain_config.item_terminology_plural
+        domain_config = domain_config or self.domain_config
+        if domain_config:
+            ai_role = domain_config.ai_role
+            content_focus = domain_config.content_focus
+            item_term_plural = domain_config.item_terminology_plural
 
         # Get paper topics and headlines
         topics = []
@@ -309,7 +309,6 @@ Respond with ONLY a JSON object:
                 keywords=",".join(result.keywords),
                 order=i,
                 is_top_pick=result.is_top_pick,
-                paper_count=len(result.paper_ids),
                 importance_score=result.importance_score,
             )
 
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.models.paper import Paper
-from app.models.app_settings import AppSettings
+from app.models.app_settings import AppSettings, DEFAULT_CREDIBILITY_WEIGHTS
 from app.ai.providers.base import get_ai_provider
 
 
@@ -16,8 +16,12 @@ class CredibilityAnalyzer:
         self.db = db
         self._weights = None
     
-    async def _get_weights(self) -> dict:
-        """Get credibility weights from settings."""
+    async def load_weights(self) -> dict:
+        """Get credibility weights from settings, querying them only once.
+
+        Callers that run ``analyze`` concurrently on one session call this
+        first, so the fan-out itself issues no queries.
+        """
         if self._weights is None:
             result = await self.db.execute(
                 select(AppSettings).where(AppSettings.id == 1)
@@ -25,24 +29,9 @@ class CredibilityAnalyzer:
             settings = result.scalar_one_or_none()
             
             if settings:
-                self._weights = {
-                    "journal_impact": settings.journal_impact_weight,
-                    "author_hindex": settings.author_hindex_weight,
-                    "sample_size": settings.sample_size_weight,
-                    "methodology": settings.methodology_weight,
-                    "peer_review": settings.peer_review_weight,
-                    "citation_velocity": settings.citation_velocity_weight,
-                }
+                self._weights = settings.credibility_weights
             else:
-                # Default weights
-                self._weights = {
-                    "journal_impact": 0.25,
-                    "author_hindex": 0.15,
-                    "sample_size": 0.20,
-                    "methodology": 0.20,
-                    "peer_review": 0.10,
-                    "citation_velocity": 0.10,
-                }
+                self._weights = dict(DEFAULT_CREDIBILITY_WEIGHTS)
         
         return self._weights
     
@@ -53,7 +42,7 @@ class CredibilityAnalyzer:
         Returns:
             Tuple of (score, breakdown_dict, credibility_note)
         """
-        weights = await self._get_weights()
+        weights = await self.load_weights()
         breakdown = {}
         
         # 1. Journal Impact Factor Score (0-100)
@@ -136,7 +125,7 @@ class CredibilityAnalyzer:
         if not paper.authors:
             return 50.0  # Neutral
         
-        h_indices = [a.h_index for a in paper.authors if a.h_index is not None]
+        h_indices = [a["h_index"] for a in paper.authors if a.get("h_index") is not None]
         if not h_indices:
             return 50.0
         
@@ -157,7 +146,7 @@ class CredibilityAnalyzer:
         if not paper.authors:
             return "No author information"
         
-        h_indices = [(a.name, a.h_index) for a in paper.authors if a.h_index is not None]
+        h_indices = [(a["name"], a["h_index"]) for a in paper.authors if a.get("h_index") is not None]
         if not h_indices:
             return "Author h-indices not available"
         
@@ -338,7 +327,7 @@ Reply with ONLY the category name."""
             return self._generate_credibility_note(score, breakdown, paper)
         
         # Build context for AI
-        author_info = ", ".join([a.name for a in (paper.authors or [])[:3]]) or "Unknown authors"
+        author_info = ", ".join([a["name"] for a in (paper.authors or [])[:3]]) or "Unknown authors"
         
         prompt = f"""You are a scientific credibility analyst. Assess this paper's trustworthiness in 2-3 sentences.
 
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.database import get_db
-from app.models.paper import Paper, Author
+from app.models.paper import Paper
 from app.models.digest import Digest, DigestPaper, DigestStatus
 from app.demo.mock_data import get_mock_papers, get_mock_summary, get_mock_credibility
 
@@ -16,55 +16,56 @@ router = APIRouter()
 async def seed_demo_papers(db: AsyncSession = Depends(get_db)):
     """Seed the database with demo papers for testing."""
     mock_papers = get_mock_papers(8)
-    created = 0
     
-    for paper_data in mock_papers:
-        # Check if already exists
-        existing = await db.execute(
-            select(Paper).where(Paper.source_id == paper_data["source_id"])
+    # Skip papers that were already seeded (one lookup for the whole batch)
+    existing = await db.execute(
+        select(Paper.source_id).where(
+            Paper.source_id.in_([p["source_id"] for p in mock_papers])
         )
-        if existing.scalar_one_or_none():
+    )
+    existing_ids = set(existing.scalars())
+    
+    rows = []
+    for paper_data in mock_papers:
+        if paper_data["source_id"] in existing_ids:
             continue
         
         # Get mock summary and credibility
         summary = get_mock_summary(paper_data["title"])
         score, breakdown, note = get_mock_credibility(paper_data)
         
-        paper = Paper(
-            title=paper_data["title"],
-            abstract=paper_data["abstract"],
-            journal=paper_data["journal"],
-            doi=paper_data.get("doi"),
-            url=paper_data.get("url"),
-            source=paper_data["source"],
-            source_id=paper_data["source_id"],
-            published_date=paper_data["published_date"],
-            citations=paper_data.get("citations"),
-            journal_impact_factor=paper_data.get("journal_impact_factor"),
-            is_preprint=paper_data.get("is_preprint", False),
-            is_peer_reviewed=not paper_data.get("is_preprint", False),
+        rows.append({
+            "title": paper_data["title"],
+            "abstract": paper_data["abstract"],
+            "journal": paper_data["journal"],
+            "doi": paper_data.get("doi"),
+            "url": paper_data.get("url"),
+            "source": paper_data["source"],
+            "source_id": paper_data["source_id"],
+            "published_date": paper_data["published_date"],
+            "citations": paper_data.get("citations"),
+            "journal_impact_factor": paper_data.get("journal_impact_factor"),
+            "is_preprint": paper_data.get("is_preprint", False),
+            "is_peer_reviewed": not paper_data.get("is_preprint", False),
             # Pre-populated AI content
-            summary_headline=summary["headline"],
-            summary_takeaway=summary["takeaway"],
-            summary_why_matters=summary["why_matters"],
-            key_takeaways=summary.get("key_takeaways", []),
-            tags=summary["tags"],
-            credibility_score=score,
-            credibility_breakdown=breakdown,
-            credibility_note=note,
-        )
-        
-        # Add authors
-        for author_name in paper_data.get("authors", []):
-            author = Author(
-                name=author_name,
-                h_index=50 + hash(author_name) % 30,  # Mock h-index
-            )
-            paper.authors.append(author)
-        
-        db.add(paper)
-        created += 1
+            "summary_headline": summary["headline"],
+            "summary_takeaway": summary["takeaway"],
+            "summary_why_matters": summary["why_matters"],
+            "key_takeaways": summary.get("key_takeaways", []),
+            "tags": summary["tags"],
+            "credibility_score": score,
+            "credibility_breakdown": breakdown,
+            "credibility_note": note,
+            "authors": [
+                {
+                    "name": author_name,
+                    "h_index": 50 + hash(author_name) % 30,  # Mock h-index
+                }
+                for author_name in paper_data.get("authors", [])
+            ],
+        })
     
+    created = len(await Paper.bulk_create(db, rows)) if rows else 0
     await db.commit()
     
     return {
@@ -121,7 +122,7 @@ async def create_demo_digest(db: AsyncSession = Depends(get_db)):
 async def clear_demo_data(db: AsyncSession = Depends(get_db)):
     """Clear all demo data from the database."""
     from app.models.digest import DigestPaper, Digest
-    from app.models.paper import Paper, Author
+    from app.models.paper import Paper
     from app.models.fetch_job import FetchJob
     
     # Delete in order due to foreign keys
@@ -132,9 +133,6 @@ async def clear_demo_data(db: AsyncSession = Depends(get_db)):
     for digest in (await db.execute(select(Digest))).scalars().all():
         await db.delete(digest)
     
-    for author in (await db.execute(select(Author))).scalars().all():
-        await db.delete(author)
-    
     for paper in (await db.execute(select(Paper))).scalars().all():
         await db.delete(paper)
     
@@ -1,13 +1,13 @@
 """Digest-related API endpoints."""
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func
+from sqlalchemy import select, desc, func, lambda_stmt
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.models.digest import Digest, DigestPaper, DigestStatus
-from app.models.paper import Paper
 from app.models.schemas import DigestCreateRequest
 from app.api.papers import paper_to_dict
 
@@ -54,27 +54,29 @@ async def list_digests(
     db: AsyncSession = Depends(get_db),
 ):
     """List all digests with pagination."""
-    query = select(Digest).options(
-        selectinload(Digest.digest_papers).selectinload(DigestPaper.paper).selectinload(Paper.authors)
-    ).order_by(desc(Digest.created_at))
+    # Compiled once per shape via lambda_stmt; closure values become binds
+    query = lambda_stmt(lambda: select(Digest).options(
+        selectinload(Digest.digest_papers).selectinload(DigestPaper.paper)
+    ).order_by(desc(Digest.created_at)))
     
     if status:
-        query = query.where(Digest.status == status)
+        query += lambda s: s.where(Digest.status == status)
     
     # Get total
     count_result = await db.execute(select(func.count(Digest.id)))
     total = count_result.scalar() or 0
     
-    query = query.offset(skip).limit(limit)
+    query += lambda s: s.offset(skip).limit(limit)
     result = await db.execute(query)
     digests = result.scalars().all()
     
-    return {
+    # Bypass jsonable_encoder, as in list_papers
+    return ORJSONResponse({
         "digests": [digest_to_dict(d) for d in digests],
         "total": total,
         "skip": skip,
         "limit": limit,
-    }
+    })
 
 
 @router.post("/")
@@ -107,7 +109,7 @@ async def get_digest(digest_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific digest."""
     result = await db.execute(
         select(Digest).options(
-            selectinload(Digest.digest_papers).selectinload(DigestPaper.paper).selectinload(Paper.authors)
+            selectinload(Digest.digest_papers).selectinload(DigestPaper.paper)
         ).where(Digest.id == digest_id)
     )
     digest = result.scalar_one_or_none()
@@ -163,7 +165,7 @@ async def update_digest(
     """Update digest content for newsletter editing."""
     result = await db.execute(
         select(Digest).options(
-            selectinload(Digest.digest_papers).selectinload(DigestPaper.paper).selectinload(Paper.authors)
+            selectinload(Digest.digest_papers).selectinload(DigestPaper.paper)
         ).where(Digest.id == digest_id)
     )
     digest = result.scalar_one_or_none()
@@ -1,4 +1,5 @@
 """Newsletter generation and export API endpoints."""
+import traceback
 from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Response, Request
 from fastapi.responses import FileResponse
@@ -8,7 +9,6 @@ from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.models.digest import Digest, DigestPaper
-from app.models.paper import Paper
 from app.models.schemas import NewsletterExportRequest, DigestStatus
 from app.composers.html_composer import HTMLComposer
 from app.composers.pdf_composer import PDFComposer
@@ -23,7 +23,6 @@ def _get_digest_query(digest_id: int):
     return select(Digest).options(
         selectinload(Digest.digest_papers)
         .selectinload(DigestPaper.paper)
-        .selectinload(Paper.authors)
     ).where(Digest.id == digest_id)
 
 
@@ -95,7 +94,6 @@ async def preview_newsletter(
     db: AsyncSession = Depends(get_db),
 ):
     """Get HTML preview of the newsletter."""
-    import traceback
     try:
         result = await db.execute(_get_digest_query(digest_id))
         digest = result.scalar_one_or_none()
@@ -1,17 +1,20 @@
 """Paper-related API endpoints."""
+import base64
+import binascii
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, Query, HTTPException, UploadFile, File
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, desc, func, lambda_stmt, tuple_
 
 from app.core.database import get_db
 from app.core.config import settings
-from app.models.paper import Paper, Author
+from app.models.paper import Paper
 from app.services.pdf_extractor import pdf_extractor
 
 router = APIRouter()
@@ -56,16 +59,11 @@ async def upload_pdf(
             source_id=file_id,
             url=f"/uploads/pdfs/{safe_filename}",
             published_date=extracted.published_date,
-            fetched_at=datetime.utcnow(),
             is_preprint=False,
             is_peer_reviewed=False,  # Unknown for uploads
+            authors=[{"name": author_name} for author_name in extracted.authors[:10]],
         )
         
-        # Add authors
-        for author_name in extracted.authors[:10]:
-            author = Author(name=author_name)
-            paper.authors.append(author)
-        
         db.add(paper)
         await db.commit()
         await db.refresh(paper)
@@ -76,7 +74,7 @@ async def upload_pdf(
                 "id": paper.id,
                 "title": paper.title,
                 "abstract": paper.abstract[:200] + "..." if paper.abstract and len(paper.abstract) > 200 else paper.abstract,
-                "authors": [a.name for a in paper.authors],
+                "authors": [a["name"] for a in paper.authors],
                 "source": paper.source,
             }
         }
@@ -122,54 +120,89 @@ def paper_to_dict(paper: Paper) -> dict:
         "sample_size": paper.sample_size,
         "methodology_quality": paper.methodology_quality,
         "is_preprint": paper.is_preprint,
-        "authors": [{"id": a.id, "name": a.name, "affiliation": a.affiliation, "h_index": a.h_index} for a in paper.authors],
+        "authors": [{"name": a["name"], "affiliation": a.get("affiliation"), "h_index": a.get("h_index")} for a in paper.authors or ()],
     }
 
 
+def encode_cursor(paper: Paper) -> str:
+    """Encode a paper's position in the (fetched_at, id) list order."""
+    return base64.urlsafe_b64encode(
+        orjson.dumps([paper.fetched_at.isoformat(), paper.id])
+    ).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor from encode_cursor, raising 400 if it is malformed."""
+    try:
+        fetched_at, paper_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(fetched_at), int(paper_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/")
 async def list_papers(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     source: Optional[str] = None,
     min_credibility: Optional[float] = Query(None, ge=0, le=100),
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """List papers with optional filtering."""
-    query = select(Paper).options(selectinload(Paper.authors)).order_by(desc(Paper.fetched_at))
+    """List papers with optional filtering.
+    
+    Pass ``next_cursor`` from a previous page as ``cursor`` to seek straight
+    to the following page; unlike ``skip``, the cost does not grow with depth.
+    """
+    # lambda_stmt caches the compiled SQL per filter combination; the
+    # closure values are passed as bound parameters
+    query = lambda_stmt(
+        lambda: select(Paper).order_by(desc(Paper.fetched_at), desc(Paper.id))
+    )
     
     if source:
-        query = query.where(Paper.source == source)
+        query += lambda s: s.where(Paper.source == source)
     if min_credibility is not None:
-        query = query.where(Paper.credibility_score >= min_credibility)
+        query += lambda s: s.where(Paper.credibility_score >= min_credibility)
     if from_date:
-        query = query.where(Paper.published_date >= from_date)
+        query += lambda s: s.where(Paper.published_date >= from_date)
     if to_date:
-        query = query.where(Paper.published_date <= to_date)
+        query += lambda s: s.where(Paper.published_date <= to_date)
     
     # Get total count
     count_result = await db.execute(select(func.count(Paper.id)))
     total = count_result.scalar() or 0
     
     # Apply pagination
-    query = query.offset(skip).limit(limit)
+    if cursor:
+        # Seek past the cursor row using ix_papers_fetched_at_id
+        cursor_fetched_at, cursor_id = decode_cursor(cursor)
+        query += lambda s: s.where(
+            tuple_(Paper.fetched_at, Paper.id) < tuple_(cursor_fetched_at, cursor_id)
+        ).limit(limit)
+    else:
+        query += lambda s: s.offset(skip).limit(limit)
     result = await db.execute(query)
     papers = result.scalars().all()
     
-    return {
+    # Returning the response directly skips FastAPI's jsonable_encoder
+    # pass over every paper dict; orjson encodes the payload as-is
+    return ORJSONResponse({
         "papers": [paper_to_dict(p) for p in papers],
         "total": total,
         "skip": skip,
         "limit": limit,
-    }
+        "next_cursor": encode_cursor(papers[-1]) if len(papers) == limit else None,
+    })
 
 
 @router.get("/{paper_id}")
 async def get_paper(paper_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific paper by ID."""
     result = await db.execute(
-        select(Paper).options(selectinload(Paper.authors)).where(Paper.id == paper_id)
+        select(Paper).where(Paper.id == paper_id)
     )
     paper = result.scalar_one_or_none()
     
@@ -93,23 +93,8 @@ async def update_credibility_weights(
     for field, value in request.model_dump(exclude_unset=True).items():
         setattr(settings, field, value)
     
-    # Normalize weights to sum to 1.0
-    total = (
-        settings.journal_impact_weight +
-        settings.author_hindex_weight +
-        settings.sample_size_weight +
-        settings.methodology_weight +
-        settings.peer_review_weight +
-        settings.citation_velocity_weight
-    )
-    
-    if total > 0:
-        settings.journal_impact_weight /= total
-        settings.author_hindex_weight /= total
-        settings.sample_size_weight /= total
-        settings.methodology_weight /= total
-        settings.peer_review_weight /= total
-        settings.citation_velocity_weight /= total
+    # Normalize weights to sum to 1.0 so readers can use them as-is
+    settings.normalize_credibility_weights()
     
     await db.commit()
     await db.refresh(settings)
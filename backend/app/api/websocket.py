@@ -1,9 +1,10 @@
 """WebSocket endpoint for real-time Live Pulse updates."""
 import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +16,16 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _encode_message(message: Union[dict, bytes]) -> str:
+    """Serialize a broadcast message to JSON text once for all clients.
+
+    Messages from the notifier arrive already serialized as bytes.
+    """
+    if isinstance(message, bytes):
+        return message.decode()
+    return orjson.dumps(message).decode()
+
+
 class ConnectionManager:
     """Manages WebSocket connections for Live Pulse.
 
@@ -87,15 +98,16 @@ class ConnectionManager:
     async def broadcast_to_domain(
         self,
         domain_id: str,
-        message: dict
+        message: Union[dict, bytes]
     ):
         """Broadcast a message to all connections subscribed to a domain."""
         connections = self.active_connections.get(domain_id, [])
         disconnected = []
+        text = _encode_message(message)
 
         for connection in connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
             except Exception as e:
                 logger.error(f"Error broadcasting to domain {domain_id}: {e}")
                 disconnected.append(connection)
@@ -104,13 +116,14 @@ class ConnectionManager:
         for conn in disconnected:
             self.disconnect(conn)
 
-    async def broadcast_global(self, message: dict):
+    async def broadcast_global(self, message: Union[dict, bytes]):
         """Broadcast a message to all global connections."""
         disconnected = []
+        text = _encode_message(message)
 
         for connection in self.global_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
             except Exception as e:
                 logger.error(f"Error broadcasting globally: {e}")
                 disconnected.append(connection)
@@ -120,7 +133,7 @@ class ConnectionManager:
 
     async def broadcast(
         self,
-        message: dict,
+        message: Union[dict, bytes],
         domain_id: Optional[str] = None
     ):
         """Broadcast a message to appropriate connections.
@@ -128,6 +141,10 @@ class ConnectionManager:
         If domain_id is provided, sends to domain subscribers AND global.
         If domain_id is None, sends only to global subscribers.
         """
+        # Encode once for both audiences
+        if not isinstance(message, bytes):
+            message = orjson.dumps(message)
+
         if domain_id:
             await self.broadcast_to_domain(domain_id, message)
 
@@ -147,9 +164,9 @@ manager = ConnectionManager()
 
 
 # Register with notifier for automatic broadcasts
-async def _broadcast_callback(message: dict):
+async def _broadcast_callback(payload: bytes):
     """Callback for live_pulse_notifier to broadcast messages."""
-    await manager.broadcast_global(message)
+    await manager.broadcast_global(payload)
 
 
 live_pulse_notifier.subscribe(_broadcast_callback)
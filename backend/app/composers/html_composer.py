@@ -106,7 +106,7 @@ class HTMLComposer:
                 "credibility_score": paper.credibility_score if paper.credibility_score is not None else 0,
                 "credibility_note": paper.credibility_note or "",
                 "journal": paper.journal or "Unknown",
-                "authors": ", ".join(a.name for a in paper.authors[:3]) if paper.authors else "",
+                "authors": ", ".join(a["name"] for a in paper.authors[:3]) if paper.authors else "",
                 "url": paper.url or "#",
                 "image_path": self._get_image_url(paper.image_path) if paper.image_path else "",
                 "tags": paper.tags or [],
@@ -51,7 +51,7 @@ class MarkdownComposer:
             if paper.journal:
                 meta_parts.append(f"**Journal:** {paper.journal}")
             if paper.authors:
-                authors = ", ".join(a.name for a in paper.authors[:3])
+                authors = ", ".join(a["name"] for a in paper.authors[:3])
                 meta_parts.append(f"**Authors:** {authors}")
             if paper.is_preprint:
                 meta_parts.append("⚠️ *Preprint*")
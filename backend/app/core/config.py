@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     # Database (default to SQLite for easy testing)
     database_url: str = "sqlite+aiosqlite:///./science_digest.db"
     database_echo: bool = False
+    # Connection pool (PostgreSQL only; SQLite keeps SQLAlchemy's defaults)
+    database_pool_size: int = 20
+    database_max_overflow: int = 10
+    database_pool_recycle: int = 300  # Seconds before a connection is replaced
+    database_pool_warm_size: int = 10  # Connections opened at startup
     
     # Demo mode (works without external APIs)
     demo_mode: bool = True
@@ -39,6 +44,8 @@ class Settings(BaseSettings):
     default_ai_provider: Literal["openai", "anthropic", "ollama", "gemini", "groq"] = "gemini"
     default_ai_model: str = "gemini-2.0-flash-exp"
     default_image_provider: Literal["dalle", "gemini", "stable_diffusion"] = "gemini"
+    digest_ai_concurrency: int = 4  # Digest papers processed at once
+    triage_concurrency: int = 8  # Fetched papers triaged at once
     
     # Email
     sendgrid_api_key: str = ""
@@ -47,6 +54,7 @@ class Settings(BaseSettings):
     smtp_user: str = ""
     smtp_password: str = ""
     email_from: str = "digest@sciencenews.local"
+    email_max_concurrency: int = 20  # Recipients sent to at once
     
     # External APIs
     semantic_scholar_api_key: str = ""
@@ -1,14 +1,69 @@
 """Database connection and session management."""
+import asyncio
+
+import orjson
+from sqlalchemy import JSON, DateTime, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
 
 from app.core.config import settings
 
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
-    pass
+    
+    # Load server-generated defaults (func.now() timestamps) during the
+    # flush; an expired attribute cannot be lazy-loaded on an AsyncSession
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# JSON column type stored as binary JSONB on PostgreSQL (indexable, no
+# text re-parse on read); plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def json_dumps(value) -> str:
+    """Serialize a JSON column value with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class utcnow(FunctionElement):
+    """Current UTC timestamp, for server defaults of keyset sort columns.
+
+    Renders ``now()`` except on SQLite. There, CURRENT_TIMESTAMP stores
+    whole-second text ("YYYY-MM-DD HH:MM:SS"), while SQLAlchemy binds
+    datetimes with microseconds. A stored value then sorts before the
+    same moment bound as a parameter, and tuple comparisons against a
+    cursor stop advancing. This writes the format SQLAlchemy binds.
+    """
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
 
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "now()"
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+# Pool sizing for server databases: bulk inserts, the fetch pipeline and
+# API requests all hold connections at once. pool_pre_ping drops
+# connections the server closed while they sat idle in the pool
+pool_options = {}
+if not settings.database_url.startswith("sqlite"):
+    pool_options = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": True,
+    }
 
 # Create async engine
 # Note: SQLite async (aiosqlite) doesn't use check_same_thread parameter
@@ -16,6 +71,10 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     future=True,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
+    query_cache_size=1200,  # Room for every lambda_stmt filter combination
+    **pool_options,
 )
 
 async_session_maker = async_sessionmaker(
@@ -42,3 +101,22 @@ async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_pool():
+    """Open pooled connections up front.
+
+    Concurrent fetches would otherwise all pay connection setup (TCP, TLS,
+    auth) at the start of the first job. No-op on SQLite.
+    """
+    if not pool_options or settings.database_pool_warm_size <= 0:
+        return
+
+    async def _connect():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Held concurrently, so each one is a new connection returned to the pool
+    await asyncio.gather(*[
+        _connect() for _ in range(min(settings.database_pool_warm_size, settings.database_pool_size))
+    ])
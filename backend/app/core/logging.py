@@ -0,0 +1,57 @@
+"""Application logging setup.
+
+Records from the ``app`` loggers are put on an in-memory queue by the
+calling thread and written out by a background listener thread, so
+logging never blocks the event loop on stream I/O.
+"""
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+from app.core.config import settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging() -> None:
+    """Route ``app`` log records through a queue to a stderr writer thread.
+
+    Logs at DEBUG (including per-paper fetch messages) in debug mode and at
+    INFO otherwise. Calling it again is a no-op.
+    """
+    global _queue_handler, _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    app_logger = logging.getLogger("app")
+    app_logger.addHandler(_queue_handler)
+    app_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+    # The queue handler is the only writer; don't also pass records to
+    # root handlers on this thread
+    app_logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _queue_handler, _listener
+    if _listener is None:
+        return
+
+    app_logger = logging.getLogger("app")
+    app_logger.removeHandler(_queue_handler)
+    app_logger.propagate = True
+    _listener.stop()
+    _queue_handler = None
+    _listener = None
@@ -96,9 +96,14 @@ class BaseFetcher(ABC):
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class NewsData:
-    """Standardized news item from any non-academic source."""
+    """Standardized news item from any non-academic source.
+    
+    Slotted and immutable: fetchers create many of these per run and
+    nothing mutates them after construction. Identity is (source,
+    source_id), so items can be deduplicated with a set or dict.
+    """
     title: str
     summary: Optional[str]
     source: str
@@ -117,6 +122,14 @@ class NewsData:
     
     # Raw data for debugging
     raw_data: Optional[dict] = field(default=None, repr=False)
+    
+    def __eq__(self, other):
+        if not isinstance(other, NewsData):
+            return NotImplemented
+        return (self.source, self.source_id) == (other.source, other.source_id)
+    
+    def __hash__(self):
+        return hash((self.source, self.source_id))
 
 
 class BaseNewsFetcher(ABC):
@@ -6,9 +6,16 @@ No API key required but may be rate limited.
 from datetime import datetime, timezone
 from typing import Optional, List, AsyncIterator
 import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from urllib.parse import quote_plus
 
 from app.fetchers.base import BaseNewsFetcher, NewsData
 
+logger = logging.getLogger(__name__)
+
 
 class PyTrendsFetcher(BaseNewsFetcher):
     """Fetcher for Google Trends via PyTrends."""
@@ -18,6 +25,34 @@ class PyTrendsFetcher(BaseNewsFetcher):
     rate_limit = 0.2  # Very conservative - Google rate limits
     requires_api_key = False
     
+    EXPLORE_URL = "https://trends.google.com/trends/explore?q="
+    
+    # TrendReq performs a cookie handshake with Google when constructed.
+    # Fetchers are instantiated per job, so the session lives on the class
+    # and is rebuilt periodically (or after an error) to pick up new cookies.
+    CLIENT_MAX_AGE = 3600.0  # seconds
+    _client = None
+    _client_created_at = 0.0
+    _client_lock = threading.RLock()
+    
+    @classmethod
+    def _get_client(cls):
+        """Return the shared TrendReq session, creating it if needed."""
+        from pytrends.request import TrendReq
+        
+        with cls._client_lock:
+            now = time.monotonic()
+            if cls._client is None or now - cls._client_created_at > cls.CLIENT_MAX_AGE:
+                cls._client = TrendReq(hl='en-US', tz=360)
+                cls._client_created_at = now
+            return cls._client
+    
+    @classmethod
+    def close(cls):
+        """Drop the shared session so the next fetch re-handshakes."""
+        with cls._client_lock:
+            cls._client = None
+    
     async def fetch(
         self,
         keywords: Optional[List[str]] = None,
@@ -28,9 +63,8 @@ class PyTrendsFetcher(BaseNewsFetcher):
         
         Keywords are used to find related trending topics.
         """
-        try:
-            from pytrends.request import TrendReq
-        except ImportError:
+        # Fail fast if pytrends is missing; _get_client() does the real import
+        if importlib.util.find_spec("pytrends") is None:
             raise ImportError("pytrends not installed. Run: pip install pytrends")
         
         await self._rate_limit()
@@ -38,24 +72,22 @@ class PyTrendsFetcher(BaseNewsFetcher):
         # Run pytrends in thread pool (it's sync)
         loop = asyncio.get_event_loop()
         
+        # Trends have no publish time; stamp every item with the fetch time
+        fetched_at = datetime.now(timezone.utc)
+        
         try:
-            # Initialize pytrends
-            pytrends = await loop.run_in_executor(
-                None,
-                lambda: TrendReq(hl='en-US', tz=360)
-            )
+            # Reuse the shared pytrends session
+            pytrends = await loop.run_in_executor(None, self._get_client)
             
             if keywords:
-                # Get related queries for keywords
-                await loop.run_in_executor(
-                    None,
-                    lambda: pytrends.build_payload(keywords[:5], timeframe=f'now {days_back}-d')
-                )
+                # Get related queries for keywords. build_payload mutates the
+                # shared session, so hold the lock until the results are read.
+                def _related_queries():
+                    with self._client_lock:
+                        pytrends.build_payload(keywords[:5], timeframe=f'now {days_back}-d')
+                        return pytrends.related_queries()
                 
-                related = await loop.run_in_executor(
-                    None,
-                    pytrends.related_queries
-                )
+                related = await loop.run_in_executor(None, _related_queries)
                 
                 count = 0
                 for kw, data in related.items():
@@ -65,37 +97,39 @@ class PyTrendsFetcher(BaseNewsFetcher):
                     # Rising queries
                     rising = data.get("rising")
                     if rising is not None and not rising.empty:
-                        for _, row in rising.head(5).iterrows():
+                        for row in rising.head(5).itertuples(index=False):
                             if count >= max_results:
                                 break
                             
-                            query = row.get("query", "")
+                            query = getattr(row, "query", "")
                             if query:
                                 yield NewsData(
                                     title=f"Rising: {query}",
                                     summary=f"Related to '{kw}' - Rising interest",
                                     source=self.source_name,
                                     source_id=f"rising_{kw}_{query}",
-                                    url=f"https://trends.google.com/trends/explore?q={query.replace(' ', '%20')}",
-                                    published_date=datetime.now(timezone.utc),
+                                    url=self.EXPLORE_URL + quote_plus(query),
+                                    published_date=fetched_at,
                                     author="Google Trends",
                                     category=self.category,
                                     tags=["trends", "rising", kw],
                                     raw_data={
                                         "related_to": kw,
-                                        "value": row.get("value"),
+                                        "value": getattr(row, "value", None),
                                     }
                                 )
                                 count += 1
             else:
-                # Get trending searches for today
-                trending = await loop.run_in_executor(
-                    None,
-                    lambda: pytrends.trending_searches(pn='united_states')
-                )
+                # Get trending searches for today; the request goes through
+                # the shared session and cookies, so it holds the lock too
+                def _trending_searches():
+                    with self._client_lock:
+                        return pytrends.trending_searches(pn='united_states')
+                
+                trending = await loop.run_in_executor(None, _trending_searches)
                 
                 count = 0
-                for idx, row in trending.head(max_results).iterrows():
+                for row in trending.head(max_results).itertuples(index=False):
                     query = row[0] if len(row) > 0 else None
                     if query:
                         yield NewsData(
@@ -103,8 +137,8 @@ class PyTrendsFetcher(BaseNewsFetcher):
                             summary="Trending on Google",
                             source=self.source_name,
                             source_id=f"trending_{query}",
-                            url=f"https://trends.google.com/trends/explore?q={query.replace(' ', '%20')}",
-                            published_date=datetime.now(timezone.utc),
+                            url=self.EXPLORE_URL + quote_plus(query),
+                            published_date=fetched_at,
                             author="Google Trends",
                             category=self.category,
                             tags=["trends", "google"],
@@ -112,6 +146,8 @@ class PyTrendsFetcher(BaseNewsFetcher):
                         )
                         count += 1
                         
-        except Exception as e:
-            print(f"PyTrends error: {e}")
+        except Exception:
+            logger.exception("PyTrends fetch failed")
+            # Cookies may have expired; start a fresh session next time
+            self.close()
             return
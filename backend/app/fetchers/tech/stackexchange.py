@@ -5,30 +5,40 @@ No API key required (300 requests/day). With key: 10K/day.
 """
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, AsyncIterator
+import asyncio
+import logging
 import httpx
-import gzip
-from io import BytesIO
+import orjson
 
 from app.fetchers.base import BaseNewsFetcher, NewsData
 
+logger = logging.getLogger(__name__)
+
 
 class StackExchangeFetcher(BaseNewsFetcher):
     """Fetcher for StackExchange trending questions."""
-    
+
     source_name = "stackexchange"
     category = "tech"
     rate_limit = 0.5  # Be conservative with rate limit
     requires_api_key = False
-    
+
     BASE_URL = "https://api.stackexchange.com/2.3"
-    
+
     # Default sites to query
     DEFAULT_SITES = ["stackoverflow", "serverfault", "superuser"]
-    
+
+    # Max sites queried at once
+    MAX_CONCURRENT_SITES = 5
+
+    # Always request a full page (API maximum) and trim locally; a second
+    # round trip costs far more than the larger response
+    PAGE_SIZE = 100
+
     def __init__(self, sites: Optional[List[str]] = None):
         super().__init__()
         self.sites = sites or self.DEFAULT_SITES
-    
+
     async def fetch(
         self,
         keywords: Optional[List[str]] = None,
@@ -36,84 +46,116 @@ class StackExchangeFetcher(BaseNewsFetcher):
         days_back: int = 7,
     ) -> AsyncIterator[NewsData]:
         """Fetch trending questions from StackExchange sites.
-        
-        Keywords are used as tags to filter questions.
+
+        Keywords are used as tags to filter questions. Sites are queried
+        concurrently; results are yielded in site order.
         """
         from_date = datetime.now(timezone.utc) - timedelta(days=days_back)
         from_timestamp = int(from_date.timestamp())
-        
+
         results_per_site = max_results // len(self.sites) + 1
-        
-        async with httpx.AsyncClient() as client:
-            for site in self.sites:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SITES)
+
+        # Query parameters shared by every site; only "site" varies
+        base_params = {
+            "pagesize": self.PAGE_SIZE,
+            "order": "desc",
+            "sort": "activity",
+            "fromdate": from_timestamp,
+            "filter": "!nNPvSNe7GZ",  # Include body excerpt
+        }
+        if keywords:
+            # Use tags for filtering (StackExchange tags are lowercase)
+            base_params["tagged"] = ";".join(kw.lower() for kw in keywords[:5])  # Max 5 tags
+        else:
+            # Get hot questions
+            base_params["sort"] = "hot"
+
+        async def _fetch_limited(site: str) -> List[NewsData]:
+            async with semaphore:
                 await self._rate_limit()
-                
-                try:
-                    params = {
-                        "site": site,
-                        "pagesize": min(results_per_site, 100),
-                        "order": "desc",
-                        "sort": "activity",
-                        "fromdate": from_timestamp,
-                        "filter": "!nNPvSNe7GZ",  # Include body excerpt
-                    }
-                    
-                    if keywords:
-                        # Use tags for filtering
-                        params["tagged"] = ";".join(keywords[:5])  # Max 5 tags
-                        endpoint = f"{self.BASE_URL}/questions"
-                    else:
-                        # Get hot questions
-                        endpoint = f"{self.BASE_URL}/questions"
-                        params["sort"] = "hot"
-                    
-                    response = await client.get(
-                        endpoint,
-                        params=params,
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-                    
-                    # StackExchange returns gzipped JSON
-                    data = response.json()
-                    
-                    questions = data.get("items", [])
-                    
-                    for q in questions:
-                        title = q.get("title")
-                        if not title:
-                            continue
-                        
-                        # Parse creation date
-                        pub_date = None
-                        if q.get("creation_date"):
-                            pub_date = datetime.fromtimestamp(
-                                q.get("creation_date"), 
-                                tz=timezone.utc
-                            )
-                        
-                        # Get tags
-                        tags = q.get("tags", [])[:5]
-                        
-                        yield NewsData(
-                            title=title,
-                            summary=q.get("body_markdown", "")[:500] if q.get("body_markdown") else None,
-                            source=self.source_name,
-                            source_id=str(q.get("question_id")),
-                            url=q.get("link"),
-                            published_date=pub_date,
-                            author=q.get("owner", {}).get("display_name"),
-                            category=self.category,
-                            tags=["stackexchange", site] + tags,
-                            raw_data={
-                                "site": site,
-                                "score": q.get("score", 0),
-                                "view_count": q.get("view_count", 0),
-                                "answer_count": q.get("answer_count", 0),
-                                "is_answered": q.get("is_answered", False),
-                            }
-                        )
-                        
-                except Exception as e:
-                    print(f"Error fetching StackExchange {site}: {e}")
-                    continue
+                return await self._fetch_site(
+                    client, site, base_params, results_per_site
+                )
+
+        # All sites share api.stackexchange.com; HTTP/2 multiplexes the
+        # concurrent requests over a single connection
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=60),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            # The API always compresses; pin gzip so the response is
+            # inflated chunk by chunk as it streams in
+            headers={"Accept-Encoding": "gzip"},
+        ) as client:
+            results = await asyncio.gather(
+                *[_fetch_limited(site) for site in self.sites],
+                return_exceptions=True,
+            )
+
+        for site, result in zip(self.sites, results):
+            if isinstance(result, Exception):
+                logger.error("Error fetching StackExchange %s", site, exc_info=result)
+                continue
+            for item in result:
+                yield item
+
+    async def _fetch_site(
+        self,
+        client: httpx.AsyncClient,
+        site: str,
+        base_params: dict,
+        results_per_site: int,
+    ) -> List[NewsData]:
+        """Fetch questions for a single StackExchange site."""
+        params = {**base_params, "site": site}
+        endpoint = f"{self.BASE_URL}/questions"
+
+        async with client.stream("GET", endpoint, params=params) as response:
+            response.raise_for_status()
+            # aread() drains aiter_bytes(), so gzip decoding overlaps the
+            # network receive; orjson parses the bytes without a str copy
+            data = orjson.loads(await response.aread())
+
+        questions = data.get("items", [])
+
+        items = []
+        for q in questions:
+            if len(items) >= results_per_site:
+                break
+
+            title = q.get("title")
+            if not title:
+                continue
+
+            # Parse creation date
+            pub_date = None
+            if q.get("creation_date"):
+                pub_date = datetime.fromtimestamp(
+                    q.get("creation_date"),
+                    tz=timezone.utc
+                )
+
+            # Get tags
+            tags = q.get("tags", [])[:5]
+
+            items.append(NewsData(
+                title=title,
+                summary=q.get("body_markdown", "")[:500] if q.get("body_markdown") else None,
+                source=self.source_name,
+                source_id=str(q.get("question_id")),
+                url=q.get("link"),
+                published_date=pub_date,
+                author=q.get("owner", {}).get("display_name"),
+                category=self.category,
+                tags=["stackexchange", site] + tags,
+                raw_data={
+                    "site": site,
+                    "score": q.get("score", 0),
+                    "view_count": q.get("view_count", 0),
+                    "answer_count": q.get("answer_count", 0),
+                    "is_answered": q.get("is_answered", False),
+                }
+            ))
+
+        return items
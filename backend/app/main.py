@@ -1,19 +1,24 @@
 """Main FastAPI application entry point."""
 # Updated for summary infographics support
+import logging
 import os
 import traceback
+import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import init_db, warm_pool
+from app.core.logging import setup_logging, shutdown_logging
 from app.api import router as api_router
 
+logger = logging.getLogger(__name__)
+
 # Ensure directories exist before app initialization
 Path(settings.upload_dir).mkdir(parents=True, exist_ok=True)
 Path(settings.generated_images_dir).mkdir(parents=True, exist_ok=True)
@@ -23,12 +28,14 @@ Path(settings.generated_images_dir).mkdir(parents=True, exist_ok=True)
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
+    setup_logging()
     await init_db()
+    await warm_pool()
     
     yield
     
     # Shutdown
-    pass
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -36,18 +43,29 @@ app = FastAPI(
     description="Aggregates scientific papers from multiple databases, generates AI summaries with credibility analysis, and creates newsletters.",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson encodes the large paper/digest list payloads much faster
+    # than the stdlib json encoder used by JSONResponse
+    default_response_class=ORJSONResponse,
 )
 
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    """Catch all exceptions and return detailed error for debugging."""
-    error_detail = f"{type(exc).__name__}: {str(exc)}\n{traceback.format_exc()}"
-    print(f"ERROR in {request.url.path}:\n{error_detail}")
-    return JSONResponse(
+    """Log unhandled exceptions and return an id the client can report.
+
+    The traceback is only rendered into the response in debug mode.
+    """
+    error_id = uuid.uuid4().hex[:12]
+    logger.error("Unhandled error %s in %s", error_id, request.url.path, exc_info=exc)
+    if settings.debug:
+        # format_exception already ends with "ExcType: message"
+        error_detail = "".join(traceback.format_exception(exc))
+    else:
+        error_detail = f"Internal server error (id: {error_id})"
+    return ORJSONResponse(
         status_code=500,
-        content={"detail": error_detail}
+        content={"detail": error_detail, "error_id": error_id}
     )
 
 
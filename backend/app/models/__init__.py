@@ -1,5 +1,5 @@
 # Database models
-from app.models.paper import Paper, Author
+from app.models.paper import Paper
 from app.models.digest import Digest, DigestPaper
 from app.models.app_settings import AppSettings
 from app.models.fetch_job import FetchJob
@@ -10,7 +10,6 @@ from app.models.topic_cluster import TopicCluster, cluster_papers
 
 __all__ = [
     "Paper",
-    "Author",
     "Digest",
     "DigestPaper",
     "AppSettings",
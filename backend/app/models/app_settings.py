@@ -6,6 +6,26 @@ from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
 
 
+# Credibility factor name -> AppSettings column holding its weight
+CREDIBILITY_WEIGHT_COLUMNS = {
+    "journal_impact": "journal_impact_weight",
+    "author_hindex": "author_hindex_weight",
+    "sample_size": "sample_size_weight",
+    "methodology": "methodology_weight",
+    "peer_review": "peer_review_weight",
+    "citation_velocity": "citation_velocity_weight",
+}
+
+DEFAULT_CREDIBILITY_WEIGHTS = {
+    "journal_impact": 0.25,
+    "author_hindex": 0.15,
+    "sample_size": 0.20,
+    "methodology": 0.20,
+    "peer_review": 0.10,
+    "citation_velocity": 0.10,
+}
+
+
 class AppSettings(Base):
     """Persistent application settings."""
     __tablename__ = "app_settings"
@@ -25,13 +45,13 @@ class AppSettings(Base):
     generate_images_by_default: Mapped[bool] = mapped_column(Boolean, default=True)
     image_style: Mapped[str] = mapped_column(String(100), default="scientific_illustration")
     
-    # Credibility weights (should sum to 1.0)
-    journal_impact_weight: Mapped[float] = mapped_column(Float, default=0.25)
-    author_hindex_weight: Mapped[float] = mapped_column(Float, default=0.15)
-    sample_size_weight: Mapped[float] = mapped_column(Float, default=0.20)
-    methodology_weight: Mapped[float] = mapped_column(Float, default=0.20)
-    peer_review_weight: Mapped[float] = mapped_column(Float, default=0.10)
-    citation_velocity_weight: Mapped[float] = mapped_column(Float, default=0.10)
+    # Credibility weights (normalized to sum to 1.0 on write)
+    journal_impact_weight: Mapped[float] = mapped_column(Float, default=DEFAULT_CREDIBILITY_WEIGHTS["journal_impact"])
+    author_hindex_weight: Mapped[float] = mapped_column(Float, default=DEFAULT_CREDIBILITY_WEIGHTS["author_hindex"])
+    sample_size_weight: Mapped[float] = mapped_column(Float, default=DEFAULT_CREDIBILITY_WEIGHTS["sample_size"])
+    methodology_weight: Mapped[float] = mapped_column(Float, default=DEFAULT_CREDIBILITY_WEIGHTS["methodology"])
+    peer_review_weight: Mapped[float] = mapped_column(Float, default=DEFAULT_CREDIBILITY_WEIGHTS["peer_review"])
+    citation_velocity_weight: Mapped[float] = mapped_column(Float, default=DEFAULT_CREDIBILITY_WEIGHTS["citation_velocity"])
     
     # Fetch settings
     enabled_sources: Mapped[list] = mapped_column(JSON, default=list)
@@ -47,5 +67,20 @@ class AppSettings(Base):
     auto_fetch_enabled: Mapped[bool] = mapped_column(Boolean, default=False)
     auto_fetch_cron: Mapped[str] = mapped_column(String(100), default="0 8 * * 1")  # Weekly Monday 8am
     
+    @property
+    def credibility_weights(self) -> dict:
+        """Credibility weights keyed by factor name."""
+        return {
+            factor: getattr(self, column)
+            for factor, column in CREDIBILITY_WEIGHT_COLUMNS.items()
+        }
+
+    def normalize_credibility_weights(self):
+        """Scale the credibility weights so they sum to 1.0."""
+        total = sum(getattr(self, column) for column in CREDIBILITY_WEIGHT_COLUMNS.values())
+        if total > 0:
+            for column in CREDIBILITY_WEIGHT_COLUMNS.values():
+                setattr(self, column, getattr(self, column) / total)
+
     def __repr__(self):
         return f"<AppSettings(id={self.id})>"
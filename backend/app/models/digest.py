@@ -1,8 +1,9 @@
 """Digest database model."""
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Text, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy import String, Text, Integer, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 import enum
 
 from app.core.database import Base
@@ -19,6 +20,10 @@ class DigestStatus(str, enum.Enum):
 class DigestPaper(Base):
     """Association table linking digests to papers with order."""
     __tablename__ = "digest_papers"
+    __table_args__ = (
+        # Serves Digest.digest_papers (filtered by digest, ordered by order)
+        Index("ix_digest_papers_digest_order", "digest_id", "order"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     digest_id: Mapped[int] = mapped_column(ForeignKey("digests.id", ondelete="CASCADE"))
@@ -27,7 +32,8 @@ class DigestPaper(Base):
     
     # Relationships
     digest: Mapped["Digest"] = relationship(back_populates="digest_papers")
-    paper: Mapped["Paper"] = relationship()
+    # Always needed alongside the link row; batch-load with one IN query
+    paper: Mapped["Paper"] = relationship(lazy="selectin")
 
 
 class Digest(Base):
@@ -56,19 +62,20 @@ class Digest(Base):
     summary_image_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  # Da Vinci style summary infographic
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Relationships
     digest_papers: Mapped[List["DigestPaper"]] = relationship(
         back_populates="digest",
         cascade="all, delete-orphan",
-        order_by="DigestPaper.order"
+        order_by="DigestPaper.order",
+        lazy="selectin",
     )
     
     @property
     def papers(self):
-        """Get papers in order."""
+        """Get papers in order (loaded eagerly with the digest)."""
         return [dp.paper for dp in self.digest_papers]
     
     def __repr__(self):
@@ -1,9 +1,12 @@
 """Domain configuration model for multi-domain support."""
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Optional
-from sqlalchemy import String, Boolean, JSON, Text
+from sqlalchemy import String, Boolean, Text, JSON
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 
 class DomainConfig(Base):
@@ -39,10 +42,13 @@ class DomainConfig(Base):
     content_focus: Mapped[str] = mapped_column(String(200), default="news and information")
 
     # Credibility factors (JSON dict with factor_name: weight)
-    credibility_factors: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    credibility_factors: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
 
-    # Enabled built-in sources (JSON list of source IDs)
-    enabled_sources: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    # Enabled built-in sources (native text[] on PostgreSQL, so no JSON
+    # decode on load and ANY()/@> membership tests; JSON list elsewhere)
+    enabled_sources: Mapped[Optional[list[str]]] = mapped_column(
+        ARRAY(String(50)).with_variant(JSON(), "sqlite"), nullable=True
+    )
 
     # Description for UI
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -52,27 +58,34 @@ class DomainConfig(Base):
 
     def to_branding_dict(self) -> dict:
         """Return branding info for frontend."""
-        return {
-            "domainId": self.domain_id,
-            "appName": self.app_name,
-            "tagline": self.tagline,
-            "newsletterTitle": self.newsletter_title,
-            "footerText": self.footer_text,
-            "primaryColor": self.primary_color,
-            "secondaryColor": self.secondary_color,
-            "accentColor": self.accent_color,
-            "iconName": self.icon_name,
-            "itemSingular": self.item_singular,
-            "itemPlural": self.item_plural,
-            "sourceLabel": self.source_label,
-            "aiRole": self.ai_role,
-            "contentFocus": self.content_focus,
-            "description": self.description,
-        }
-
-
-# Default domain configurations to seed
-DEFAULT_DOMAINS = [
+        return dict(zip(_BRANDING_KEYS, _get_branding_values(self)))
+
+
+# Frontend key -> DomainConfig attribute for to_branding_dict
+_BRANDING_FIELDS = (
+    ("domainId", "domain_id"),
+    ("appName", "app_name"),
+    ("tagline", "tagline"),
+    ("newsletterTitle", "newsletter_title"),
+    ("footerText", "footer_text"),
+    ("primaryColor", "primary_color"),
+    ("secondaryColor", "secondary_color"),
+    ("accentColor", "accent_color"),
+    ("iconName", "icon_name"),
+    ("itemSingular", "item_singular"),
+    ("itemPlural", "item_plural"),
+    ("sourceLabel", "source_label"),
+    ("aiRole", "ai_role"),
+    ("contentFocus", "content_focus"),
+    ("description", "description"),
+)
+_BRANDING_KEYS = tuple(key for key, _ in _BRANDING_FIELDS)
+_get_branding_values = attrgetter(*(attr for _, attr in _BRANDING_FIELDS))
+
+
+# Default domain configurations to seed. Read-only: the rows, their
+# credibility factors and source lists are shared by every seeding call.
+DEFAULT_DOMAINS = tuple(MappingProxyType(domain) for domain in (
     {
         "domain_id": "science",
         "is_default": True,
@@ -90,15 +103,15 @@ DEFAULT_DOMAINS = [
         "ai_role": "science communicator",
         "content_focus": "scientific research",
         "description": "Aggregate and summarize scientific research papers",
-        "enabled_sources": ["pubmed", "arxiv", "biorxiv", "medrxiv", "semantic_scholar", "plos", "nature_rss", "science_rss", "lancet_rss", "nejm_rss", "bmj_rss"],
-        "credibility_factors": {
+        "enabled_sources": ("pubmed", "arxiv", "biorxiv", "medrxiv", "semantic_scholar", "plos", "nature_rss", "science_rss", "lancet_rss", "nejm_rss", "bmj_rss"),
+        "credibility_factors": MappingProxyType({
             "journal_impact": 0.25,
             "author_hindex": 0.15,
             "sample_size": 0.20,
             "methodology": 0.20,
             "peer_review": 0.10,
             "citation_velocity": 0.10,
-        },
+        }),
     },
     {
         "domain_id": "tech",
@@ -116,14 +129,14 @@ DEFAULT_DOMAINS = [
         "ai_role": "technology analyst",
         "content_focus": "technology news and innovations",
         "description": "Track technology trends and innovations",
-        "enabled_sources": ["arxiv"],
-        "credibility_factors": {
+        "enabled_sources": ("arxiv",),
+        "credibility_factors": MappingProxyType({
             "source_reputation": 0.30,
             "author_expertise": 0.20,
             "verification": 0.25,
             "recency": 0.15,
             "engagement": 0.10,
-        },
+        }),
     },
     {
         "domain_id": "business",
@@ -141,14 +154,14 @@ DEFAULT_DOMAINS = [
         "ai_role": "business analyst",
         "content_focus": "business news and market trends",
         "description": "Aggregate business and financial news",
-        "enabled_sources": [],
-        "credibility_factors": {
+        "enabled_sources": (),
+        "credibility_factors": MappingProxyType({
             "source_tier": 0.30,
             "analyst_rating": 0.20,
             "data_backed": 0.25,
             "regulatory_filing": 0.15,
             "market_impact": 0.10,
-        },
+        }),
     },
     {
         "domain_id": "health",
@@ -166,14 +179,14 @@ DEFAULT_DOMAINS = [
         "ai_role": "health communicator",
         "content_focus": "health and wellness information",
         "description": "Health and medical news for general audiences",
-        "enabled_sources": ["pubmed", "nejm_rss", "lancet_rss", "bmj_rss", "medrxiv"],
-        "credibility_factors": {
+        "enabled_sources": ("pubmed", "nejm_rss", "lancet_rss", "bmj_rss", "medrxiv"),
+        "credibility_factors": MappingProxyType({
             "journal_impact": 0.25,
             "clinical_evidence": 0.25,
             "peer_review": 0.20,
             "author_credentials": 0.15,
             "recency": 0.15,
-        },
+        }),
     },
     {
         "domain_id": "news",
@@ -191,13 +204,13 @@ DEFAULT_DOMAINS = [
         "ai_role": "news editor",
         "content_focus": "current events and news",
         "description": "General news aggregation and summarization",
-        "enabled_sources": [],
-        "credibility_factors": {
+        "enabled_sources": (),
+        "credibility_factors": MappingProxyType({
             "source_reputation": 0.35,
             "fact_check_status": 0.25,
             "corroboration": 0.20,
             "recency": 0.10,
             "transparency": 0.10,
-        },
+        }),
     },
-]
+))
@@ -1,7 +1,7 @@
 """Fetch job database model."""
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Text, Integer, DateTime, JSON, Enum
+from sqlalchemy import String, Text, Integer, DateTime, JSON, CheckConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
@@ -19,6 +19,12 @@ class FetchStatus(str, enum.Enum):
 class FetchJob(Base):
     """Tracks paper fetch operations."""
     __tablename__ = "fetch_jobs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')",
+            name="ck_fetch_jobs_status",
+        ),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     
@@ -29,9 +35,11 @@ class FetchJob(Base):
     days_back: Mapped[int] = mapped_column(Integer, default=7)
     
     # Status
-    status: Mapped[FetchStatus] = mapped_column(
-        Enum(FetchStatus),
-        default=FetchStatus.PENDING
+    # Plain string (a FetchStatus value) so rows load without an Enum
+    # type round trip; the CHECK constraint keeps the values valid
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default=FetchStatus.PENDING.value
     )
     progress: Mapped[int] = mapped_column(Integer, default=0)  # Percentage
     current_source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -43,8 +51,8 @@ class FetchJob(Base):
     errors: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
     
     # Timestamps
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     def __repr__(self):
         return f"<FetchJob(id={self.id}, status={self.status})>"
@@ -1,35 +1,46 @@
 """Paper database model."""
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import String, Text, Float, Integer, DateTime, JSON, ForeignKey, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import Dict, Optional, List
+from sqlalchemy import String, Text, Float, Integer, DateTime, JSON, Boolean, Index, Table, desc, insert, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
-from app.core.database import Base
+from app.core.database import Base, JSONType, json_dumps, utcnow
 
+# Longer titles are truncated on assignment (see Paper._truncate_title)
+TITLE_MAX_LENGTH = 500
 
-class Author(Base):
-    """Author model."""
-    __tablename__ = "authors"
-    
-    id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(255))
-    affiliation: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
-    h_index: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    semantic_scholar_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    
-    # Relationships
-    paper_id: Mapped[int] = mapped_column(ForeignKey("papers.id", ondelete="CASCADE"))
-    paper: Mapped["Paper"] = relationship(back_populates="authors")
+
+def truncate_title(value: str) -> str:
+    """Clip a title to ``TITLE_MAX_LENGTH``, marking the cut with an ellipsis."""
+    if value and len(value) > TITLE_MAX_LENGTH:
+        return value[:TITLE_MAX_LENGTH - 3].rstrip() + "..."
+    return value
 
 
 class Paper(Base):
     """Paper model representing a scientific publication."""
     __tablename__ = "papers"
+    __table_args__ = (
+        # Per-source listings, newest first
+        Index("ix_papers_source_date", "source", desc("published_date"), desc("id")),
+        # Default list order; id makes the sort key unique for seek pagination
+        Index("ix_papers_fetched_at_id", desc("fetched_at"), desc("id")),
+        # Dedup key for papers without a DOI; also the upsert conflict target
+        Index("ix_papers_source_source_id", "source", "source_id", unique=True),
+        # Tag membership queries (tags @> '["ai"]') on PostgreSQL
+        Index(
+            "ix_papers_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     
     # Basic metadata
-    title: Mapped[str] = mapped_column(String(1000))
+    title: Mapped[str] = mapped_column(String(TITLE_MAX_LENGTH))
     abstract: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     journal: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     doi: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, unique=True, index=True)
@@ -42,7 +53,9 @@ class Paper(Base):
     # Dates
     published_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Original publish time for freshness
-    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=utcnow()
+    )  # Default list order, see ix_papers_fetched_at_id
 
     # Triage fields (AI pre-filtering)
     triage_status: Mapped[Optional[str]] = mapped_column(String(20), default="pending", nullable=True)  # pending/passed/rejected
@@ -64,20 +77,24 @@ class Paper(Base):
     
     # Credibility scoring
     credibility_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    credibility_breakdown: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    credibility_breakdown: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
     is_validated_source: Mapped[bool] = mapped_column(Boolean, default=False)
     
     # AI-generated content
     summary_headline: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     summary_takeaway: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     summary_why_matters: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    key_takeaways: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)  # List of 3 key takeaways
+    key_takeaways: Mapped[Optional[list]] = mapped_column(JSONType, nullable=True)  # List of 3 key takeaways
     credibility_note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    tags: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    tags: Mapped[Optional[list]] = mapped_column(JSONType, nullable=True)
     
     # Generated image
     image_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
-    image_prompt: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Write-only prompt log, never rendered: keep it out of every SELECT.
+    # Reading it requires undefer(Paper.image_prompt) in the query
+    image_prompt: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_raiseload=True
+    )
     
     # Journal metrics (for credibility)
     journal_impact_factor: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -89,11 +106,217 @@ class Paper(Base):
     sample_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     methodology_quality: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
-    # Relationships
-    authors: Mapped[List["Author"]] = relationship(
-        back_populates="paper", 
-        cascade="all, delete-orphan"
-    )
+    # Authors, in byline order: dicts with "name" and optional
+    # "affiliation", "h_index" and "semantic_scholar_id". Stored inline so
+    # papers load without a join or a second SELECT
+    authors: Mapped[list] = mapped_column(JSONType, default=list)
+    
+    # Rows per INSERT statement in bulk_create
+    BULK_BATCH_SIZE = 10000
+    
+    @validates("title")
+    def _truncate_title(self, key: str, value: str) -> str:
+        """Clip titles to the column width at ingest."""
+        return truncate_title(value)
+    
+    @classmethod
+    async def bulk_create(cls, session: AsyncSession, rows: List[dict]) -> List[int]:
+        """Insert papers without per-object ORM bookkeeping.
+        
+        Each row holds Paper column values; as a Core insert it bypasses
+        ``_truncate_title``, so titles must already fit ``TITLE_MAX_LENGTH``.
+        Runs in the caller's transaction (no commit).
+        
+        Returns:
+            New paper IDs, in the same order as ``rows``
+        """
+        paper_ids: List[int] = []
+        for start in range(0, len(rows), cls.BULK_BATCH_SIZE):
+            batch = rows[start:start + cls.BULK_BATCH_SIZE]
+            result = await session.execute(
+                insert(cls).returning(cls.id, sort_by_parameter_order=True),
+                batch,
+            )
+            paper_ids.extend(result.scalars())
+        
+        return paper_ids
+    
+    @classmethod
+    async def bulk_upsert(cls, session: AsyncSession, rows: List[dict]) -> List[int]:
+        """Insert papers, updating any that already exist.
+        
+        One ``INSERT ... ON CONFLICT DO UPDATE`` per batch replaces the
+        SELECT-then-INSERT round trips. A row whose ``(source, source_id)``
+        is already stored updates that paper, so a preprint that later
+        gains a DOI takes it; other rows with a DOI conflict on ``doi``, the
+        rest on ``(source, source_id)``. Only the columns present in
+        ``rows`` are overwritten on conflict, so AI-generated fields
+        survive a refetch.
+        
+        Returns:
+            IDs of the inserted or updated papers
+        """
+        dialect_insert = _dialect_insert(session)
+        
+        # An upsert may not touch the same row twice, so rows repeating a
+        # source ID or DOI collapse to the last one
+        by_source_id = {(row["source"], row.get("source_id")): row for row in rows}
+        deduped = {}
+        for key, row in by_source_id.items():
+            deduped[row.get("doi") or key] = row
+        rows = list(deduped.values())
+        
+        # DOI rows whose source ID is already stored must target that row:
+        # inserting them on the doi target would violate the source index
+        doi_rows = [row for row in rows if row.get("doi")]
+        stored_source_ids = set()
+        for start in range(0, len(doi_rows), cls.BULK_BATCH_SIZE):
+            keys = [
+                (row["source"], row.get("source_id"))
+                for row in doi_rows[start:start + cls.BULK_BATCH_SIZE]
+            ]
+            result = await session.execute(
+                select(cls.source, cls.source_id).where(tuple_(cls.source, cls.source_id).in_(keys))
+            )
+            stored_source_ids.update(tuple(key) for key in result)
+        
+        # ON CONFLICT takes a single target, so the groups are upserted
+        # separately
+        groups = (
+            (("doi",), [
+                row for row in doi_rows
+                if (row["source"], row.get("source_id")) not in stored_source_ids
+            ]),
+            (("source", "source_id"), [
+                row for row in rows
+                if not row.get("doi") or (row["source"], row.get("source_id")) in stored_source_ids
+            ]),
+        )
+        
+        paper_ids: List[int] = []
+        for conflict_columns, group in groups:
+            for start in range(0, len(group), cls.BULK_BATCH_SIZE):
+                batch = group[start:start + cls.BULK_BATCH_SIZE]
+                stmt = dialect_insert(cls.__table__).values(batch)
+                update_columns = {key for row in batch for key in row} - {"id", *conflict_columns}
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(conflict_columns),
+                    set_={name: getattr(stmt.excluded, name) for name in update_columns},
+                ).returning(cls.__table__.c.id)
+                result = await session.execute(stmt)
+                paper_ids.extend(result.scalars())
+        
+        return paper_ids
+    
+    @classmethod
+    async def bulk_insert_new(cls, session: AsyncSession, rows: List[dict]) -> List["Paper"]:
+        """Insert papers, skipping any that are already stored.
+        
+        One ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` per batch: a row
+        that collides with a stored paper on ``doi`` or ``(source,
+        source_id)``, e.g. one a concurrent fetch just wrote, is skipped
+        rather than failing the batch. Titles are clipped as on assignment.
+        Runs in the caller's transaction (no commit).
+        
+        Returns:
+            The inserted papers as ORM objects, in no particular order
+        """
+        dialect_insert = _dialect_insert(session)
+        
+        papers: List[Paper] = []
+        for start in range(0, len(rows), cls.BULK_BATCH_SIZE):
+            batch = [
+                {**row, "title": truncate_title(row["title"])}
+                for row in rows[start:start + cls.BULK_BATCH_SIZE]
+            ]
+            stmt = dialect_insert(cls).values(batch).on_conflict_do_nothing().returning(cls)
+            papers.extend(await session.scalars(stmt))
+        
+        return papers
+    
+    @classmethod
+    async def copy_from(cls, session: AsyncSession, rows: List[dict]) -> List[int]:
+        """Bulk-load papers with PostgreSQL ``COPY``.
+        
+        Takes the same rows as :meth:`bulk_create`. COPY returns nothing, so
+        paper IDs are reserved from the sequence up front. It also skips
+        Python-side column defaults, so they are filled in here.
+        Falls back to :meth:`bulk_create` on other databases.
+        
+        Returns:
+            New paper IDs, in the same order as ``rows``
+        """
+        if not rows or session.bind.dialect.name != "postgresql":
+            return await cls.bulk_create(session, rows)
+        
+        result = await session.execute(
+            text("SELECT nextval(pg_get_serial_sequence('papers', 'id')) FROM generate_series(1, :n)"),
+            {"n": len(rows)},
+        )
+        paper_ids = list(result.scalars())
+        
+        paper_rows = [{**row, "id": paper_id} for paper_id, row in zip(paper_ids, rows)]
+        
+        # asyncpg exposes COPY on the driver connection of the session's transaction
+        connection = await session.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+        await _copy_rows(driver, cls.__table__, paper_rows)
+        
+        return paper_ids
     
     def __repr__(self):
         return f"<Paper(id={self.id}, title='{self.title[:50]}...')>"
+
+
+def _dialect_insert(session: AsyncSession):
+    """The ``insert`` construct with ON CONFLICT support for the session's database."""
+    dialect = session.bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT inserts are not supported on {dialect}")
+    return dialect_insert
+
+
+async def _copy_rows(driver, table: Table, rows: List[dict]):
+    """COPY dict rows into ``table``, applying scalar/callable column defaults.
+    
+    Columns with a server default are left out unless a row supplies them,
+    so the database fills them in as it would for an INSERT. Rows are
+    grouped by the server-default columns they supply and each group is
+    copied separately, so a row that omits one never sends it as NULL.
+    """
+    server_default_names = {c.name for c in table.columns if c.server_default is not None}
+    groups: Dict[frozenset, List[dict]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(server_default_names.intersection(row)), []).append(row)
+    
+    for supplied, group in groups.items():
+        columns = [
+            c for c in table.columns
+            if c.server_default is None or c.name in supplied
+        ]
+        records = []
+        for row in group:
+            record = []
+            for column in columns:
+                if column.name in row:
+                    value = row[column.name]
+                elif column.default is not None and column.default.is_scalar:
+                    value = column.default.arg
+                elif column.default is not None and column.default.is_callable:
+                    value = column.default.arg(None)
+                else:
+                    value = None
+                if isinstance(column.type, JSON) and value is not None:
+                    value = json_dumps(value)
+                record.append(value)
+            records.append(tuple(record))
+        
+        await driver.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[c.name for c in columns],
+        )
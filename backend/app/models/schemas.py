@@ -34,8 +34,7 @@ class AuthorBase(BaseModel):
 
 
 class AuthorResponse(AuthorBase):
-    model_config = ConfigDict(from_attributes=True)
-    id: int
+    """Author entry from the inline Paper.authors list (no id)."""
 
 
 # Paper schemas
@@ -90,6 +89,7 @@ class PaperListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
 
 
 # Digest schemas
@@ -1,8 +1,8 @@
 """Topic cluster model for grouping related papers."""
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Text, Integer, DateTime, Boolean, Float, ForeignKey, Table, Column
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Text, Integer, DateTime, Boolean, Float, ForeignKey, Table, Column, select, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship, column_property
 
 from app.core.database import Base
 
@@ -49,12 +49,19 @@ class TopicCluster(Base):
     icon: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # Optional icon name
 
     # Metrics
-    paper_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Derived from cluster_papers so it can never drift from the real
+    # membership; served by the (cluster_id, paper_id) primary key
+    paper_count: Mapped[int] = column_property(
+        select(func.count(cluster_papers.c.paper_id))
+        .where(cluster_papers.c.cluster_id == id)
+        .correlate_except(cluster_papers)
+        .scalar_subquery()
+    )
     importance_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # 0.0-1.0 newsworthiness
     avg_quality_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Avg paper quality
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     papers: Mapped[List["Paper"]] = relationship(
@@ -63,7 +70,9 @@ class TopicCluster(Base):
     )
 
     def __repr__(self):
-        return f"<TopicCluster(id={self.id}, name='{self.name}', papers={self.paper_count})>"
+        # paper_count is deferred; reading it here would lazy-load, which
+        # fails outside a greenlet on an AsyncSession
+        return f"<TopicCluster(id={self.id}, name='{self.name}')>"
 
 
 # Import here to avoid circular import
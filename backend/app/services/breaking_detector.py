@@ -2,6 +2,7 @@
 
 Detects breaking/urgent news based on content signals and keywords.
 """
+import bisect
 import math
 import re
 import logging
@@ -9,7 +10,9 @@ from datetime import datetime, timezone
 from typing import List, Optional, Dict, Set
 from dataclasses import dataclass
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.paper import Paper
 
@@ -17,7 +20,7 @@ from app.models.paper import Paper
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakingAnalysis:
     """Result of breaking news analysis."""
     is_breaking: bool
@@ -26,6 +29,63 @@ class BreakingAnalysis:
     signals: Dict[str, float]  # Signal name -> contribution
 
 
+@dataclass(slots=True)
+class BatchAnalysis:
+    """Results of analyzing a batch of papers."""
+    results: List[BreakingAnalysis]
+    breaking_count: int
+
+
+class _KeywordMatcher:
+    """Finds which keywords from several fixed lists occur in texts in one pass.
+
+    All keywords are folded into a single compiled alternation inside a
+    lookahead, so the regex engine scans each text once in C instead of
+    running one substring search per keyword and list. Matching is
+    case-insensitive, so texts are scanned as-is without a lowercased copy.
+    The alternation reports the longest keyword at each position; shorter
+    keywords that are prefixes of it are credited from a precomputed table.
+    """
+
+    __slots__ = ("_keyword_lists", "_positions", "_prefixes", "_pattern")
+
+    def __init__(self, *keyword_lists: List[str]):
+        self._keyword_lists = tuple(tuple(keywords) for keywords in keyword_lists)
+        # Lowercased keyword -> (list number, position in that list) pairs
+        self._positions: Dict[str, List[tuple]] = {}
+        for list_no, keywords in enumerate(keyword_lists):
+            for i, kw in enumerate(keywords):
+                self._positions.setdefault(kw.lower(), []).append((list_no, i))
+        # Lowercased keyword -> every keyword it starts with (itself included)
+        self._prefixes = {
+            kw: tuple(other for other in self._positions if kw.startswith(other))
+            for kw in self._positions
+        }
+        alternation = "|".join(
+            re.escape(kw) for kw in sorted(self._positions, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f"(?=({alternation}))", re.IGNORECASE)
+
+    def find(self, *texts: str) -> List[List[str]]:
+        """Return, per keyword list, its keywords present in any of ``texts``.
+
+        Each result list keeps the order and casing of its keyword list.
+        """
+        matched = set()
+        for text in texts:
+            for match in self._pattern.findall(text):
+                matched.update(self._prefixes[match.lower()])
+
+        hits = [[] for _ in self._keyword_lists]
+        for kw in matched:
+            for list_no, i in self._positions[kw]:
+                hits[list_no].append(i)
+        return [
+            [keywords[i] for i in sorted(list_hits)]
+            for keywords, list_hits in zip(self._keyword_lists, hits)
+        ]
+
+
 class BreakingNewsDetector:
     """Detects breaking/urgent news based on content signals.
 
@@ -82,6 +142,38 @@ class BreakingNewsDetector:
     RECENCY_THRESHOLD_FRESH = 6  # < 6 hours = fresh
     RECENCY_THRESHOLD_RECENT = 24  # < 24 hours = recent
 
+    # Ascending thresholds and the share of the recency weight for each
+    # band: very fresh, fresh, recent, old (minimal contribution)
+    RECENCY_THRESHOLDS = (
+        RECENCY_THRESHOLD_VERY_FRESH,
+        RECENCY_THRESHOLD_FRESH,
+        RECENCY_THRESHOLD_RECENT,
+    )
+    RECENCY_MULTIPLIERS = (1.0, 0.75, 0.5, 0.1)
+
+    # Freshness decays exponentially with a 24-hour half-life; the rate is
+    # folded once so scoring a paper is a single multiply and exp()
+    FRESHNESS_HALF_LIFE_HOURS = 24
+    FRESHNESS_DECAY_RATE = 0.693 / FRESHNESS_HALF_LIFE_HOURS
+
+    # Title urgency patterns, compiled case-insensitively into one
+    # alternation so a title is searched once and never lowercased
+    URGENCY_PATTERN = re.compile("|".join(f"(?:{p})" for p in (
+        r"^breaking:",
+        r"^urgent:",
+        r"^alert:",
+        r"^just in:",
+        r"^developing:",
+        r"^exclusive:",
+        r"\[breaking\]",
+        r"\[urgent\]",
+        r"!$",  # Ends with exclamation
+        r"!!!",  # Multiple exclamations
+    )), re.IGNORECASE)
+
+    # ALL CAPS words of 3+ letters (often indicates urgency)
+    CAPS_WORD_PATTERN = re.compile(r"\b[A-Z]{3,}\b")
+
     def __init__(self, breaking_threshold: float = 0.5):
         """Initialize detector.
 
@@ -93,28 +185,45 @@ class BreakingNewsDetector:
     async def analyze(
         self,
         paper: Paper,
-        domain: str = "news"
+        domain: str = "news",
+        now: Optional[datetime] = None
     ) -> BreakingAnalysis:
         """Analyze if paper should be flagged as breaking news.
 
         Args:
             paper: Paper to analyze
             domain: Domain context for keyword selection
+            now: Reference time for recency (default: current time)
 
         Returns:
             BreakingAnalysis with results
         """
+        return self.score(paper, domain, now)
+
+    def score(
+        self,
+        paper: Paper,
+        domain: str = "news",
+        now: Optional[datetime] = None
+    ) -> BreakingAnalysis:
+        """Synchronous scoring kernel behind :meth:`analyze`.
+
+        Scoring never awaits anything, so batch callers use this directly
+        and skip creating and scheduling a coroutine per paper.
+        """
         signals = {}
         keywords_found = []
         total_score = 0.0
 
-        text = f"{paper.title or ''} {paper.abstract or ''}".lower()
+        title = paper.title or ""
+        abstract = paper.abstract or ""
+
+        # One scan finds domain-specific and universal keywords together
+        matcher = _DOMAIN_MATCHERS.get(domain, _UNIVERSAL_ONLY_MATCHER)
+        domain_found, universal_found = matcher.find(title, abstract)
 
         # Check domain-specific keywords
-        domain_keywords = self.BREAKING_KEYWORDS.get(domain, [])
-        for keyword in domain_keywords:
-            if keyword.lower() in text:
-                keywords_found.append(keyword)
+        keywords_found.extend(domain_found)
 
         if keywords_found:
             # More keywords = higher score, but cap at weight
@@ -123,11 +232,7 @@ class BreakingNewsDetector:
             total_score += keyword_score
 
         # Check universal keywords
-        universal_found = []
-        for keyword in self.UNIVERSAL_KEYWORDS:
-            if keyword.lower() in text:
-                universal_found.append(keyword)
-                keywords_found.append(f"[URGENT] {keyword}")
+        keywords_found.extend(f"[URGENT] {keyword}" for keyword in universal_found)
 
         if universal_found:
             universal_score = min(len(universal_found) * 0.1, self.SIGNAL_WEIGHTS["universal_keyword"])
@@ -135,7 +240,7 @@ class BreakingNewsDetector:
             total_score += universal_score
 
         # Check recency
-        recency_score = self._calculate_recency_score(paper)
+        recency_score = self._calculate_recency_score(paper, now)
         if recency_score > 0:
             signals["recency"] = recency_score
             total_score += recency_score
@@ -173,14 +278,7 @@ class BreakingNewsDetector:
             BreakingAnalysis with results
         """
         analysis = await self.analyze(paper, domain)
-
-        # Update paper
-        paper.is_breaking = analysis.is_breaking
-        paper.breaking_score = analysis.score
-        paper.breaking_keywords = analysis.keywords_found if analysis.keywords_found else None
-
-        # Also update freshness score
-        paper.freshness_score = self.calculate_freshness(paper)
+        self._apply_analysis(paper, analysis)
 
         if db:
             db.add(paper)
@@ -188,12 +286,37 @@ class BreakingNewsDetector:
 
         return analysis
 
+    def _apply_analysis(
+        self,
+        paper: Paper,
+        analysis: BreakingAnalysis,
+        now: Optional[datetime] = None
+    ) -> None:
+        """Copy analysis results and a fresh freshness score onto the paper."""
+        for key, value in self._analysis_values(paper, analysis, now).items():
+            setattr(paper, key, value)
+
+    def _analysis_values(
+        self,
+        paper: Paper,
+        analysis: BreakingAnalysis,
+        now: Optional[datetime] = None
+    ) -> dict:
+        """Column values an analysis writes to its paper."""
+        return {
+            "is_breaking": analysis.is_breaking,
+            "breaking_score": analysis.score,
+            "breaking_keywords": analysis.keywords_found if analysis.keywords_found else None,
+            # Also update freshness score
+            "freshness_score": self.calculate_freshness(paper, now),
+        }
+
     async def analyze_batch(
         self,
         papers: List[Paper],
         domain: str = "news",
         db: Optional[AsyncSession] = None
-    ) -> List[BreakingAnalysis]:
+    ) -> BatchAnalysis:
         """Analyze multiple papers for breaking news.
 
         Args:
@@ -202,102 +325,90 @@ class BreakingNewsDetector:
             db: Database session (optional)
 
         Returns:
-            List of BreakingAnalysis results
+            BatchAnalysis with per-paper results and the breaking count
         """
         results = []
+        breaking_count = 0
+        # One reference time for the whole batch
+        now = datetime.now(timezone.utc)
 
         for paper in papers:
-            if db:
-                analysis = await self.analyze_and_update(paper, domain, db)
-            else:
-                analysis = await self.analyze(paper, domain)
+            analysis = self.score(paper, domain, now)
+            breaking_count += analysis.is_breaking
             results.append(analysis)
 
-        return results
+        if db:
+            await _bulk_update_papers(db, papers, [
+                self._analysis_values(paper, analysis, now)
+                for paper, analysis in zip(papers, results)
+            ])
+
+        return BatchAnalysis(results=results, breaking_count=breaking_count)
 
-    def _calculate_recency_score(self, paper: Paper) -> float:
-        """Calculate recency contribution to breaking score."""
+    @staticmethod
+    def _hours_old(paper: Paper, now: Optional[datetime] = None) -> Optional[float]:
+        """Hours since the paper was published (or fetched), None if unknown."""
         # Try published_at first, then published_date, then fetched_at
         pub_time = paper.published_at or paper.published_date or paper.fetched_at
 
         if not pub_time:
-            return 0.0
+            return None
 
         # Make pub_time timezone-aware if it isn't
         if pub_time.tzinfo is None:
             pub_time = pub_time.replace(tzinfo=timezone.utc)
 
-        now = datetime.now(timezone.utc)
-        hours_old = (now - pub_time).total_seconds() / 3600
-
-        if hours_old < self.RECENCY_THRESHOLD_VERY_FRESH:
-            # Very fresh: full recency weight
-            return self.SIGNAL_WEIGHTS["recency"]
-        elif hours_old < self.RECENCY_THRESHOLD_FRESH:
-            # Fresh: 75% of weight
-            return self.SIGNAL_WEIGHTS["recency"] * 0.75
-        elif hours_old < self.RECENCY_THRESHOLD_RECENT:
-            # Recent: 50% of weight
-            return self.SIGNAL_WEIGHTS["recency"] * 0.5
-        else:
-            # Old: minimal contribution
-            return self.SIGNAL_WEIGHTS["recency"] * 0.1
+        if now is None:
+            now = datetime.now(timezone.utc)
+        return (now - pub_time).total_seconds() / 3600
+
+    def _calculate_recency_score(self, paper: Paper, now: Optional[datetime] = None) -> float:
+        """Calculate recency contribution to breaking score."""
+        hours_old = self._hours_old(paper, now)
+
+        if hours_old is None:
+            return 0.0
+
+        # bisect_right: a paper exactly at a threshold falls in the older band
+        band = bisect.bisect_right(self.RECENCY_THRESHOLDS, hours_old)
+        return self.SIGNAL_WEIGHTS["recency"] * self.RECENCY_MULTIPLIERS[band]
 
     def _analyze_title_urgency(self, title: str) -> float:
         """Analyze title for urgency patterns."""
-        title_lower = title.lower()
         score = 0.0
         weight = self.SIGNAL_WEIGHTS["title_urgency"]
 
         # Check for urgency patterns
-        urgency_patterns = [
-            r"^breaking:",
-            r"^urgent:",
-            r"^alert:",
-            r"^just in:",
-            r"^developing:",
-            r"^exclusive:",
-            r"\[breaking\]",
-            r"\[urgent\]",
-            r"!$",  # Ends with exclamation
-            r"!!!",  # Multiple exclamations
-        ]
+        if self.URGENCY_PATTERN.search(title):
+            score += weight * 0.5
 
-        for pattern in urgency_patterns:
-            if re.search(pattern, title_lower):
-                score += weight * 0.5
-                break
-
-        # Check for ALL CAPS words (often indicates urgency)
-        words = title.split()
-        caps_words = [w for w in words if w.isupper() and len(w) > 2]
-        if len(caps_words) >= 2:
+        # Check for ALL CAPS words (often indicates urgency); two are
+        # enough, so stop scanning once the second one is found
+        caps_words = self.CAPS_WORD_PATTERN.finditer(title)
+        if next(caps_words, None) and next(caps_words, None):
             score += weight * 0.3
 
         return min(score, weight)
 
-    def calculate_freshness(self, paper: Paper) -> float:
+    def calculate_freshness(self, paper: Paper, now: Optional[datetime] = None) -> float:
         """Calculate freshness score with exponential decay.
 
+        Args:
+            paper: Paper to score
+            now: Reference time (default: current time); pass one value
+                when scoring many papers
+
         Returns:
             Score from 0.0 (old) to 1.0 (brand new)
         """
-        pub_time = paper.published_at or paper.published_date or paper.fetched_at
+        hours_old = self._hours_old(paper, now)
 
-        if not pub_time:
+        if hours_old is None:
             return 0.5  # Default for unknown
 
-        # Make timezone-aware
-        if pub_time.tzinfo is None:
-            pub_time = pub_time.replace(tzinfo=timezone.utc)
-
-        now = datetime.now(timezone.utc)
-        hours_old = (now - pub_time).total_seconds() / 3600
-
         # Exponential decay with 24-hour half-life
         # At 0 hours: 1.0, at 24 hours: 0.5, at 48 hours: 0.25
-        half_life_hours = 24
-        return math.exp(-0.693 * hours_old / half_life_hours)
+        return math.exp(-self.FRESHNESS_DECAY_RATE * hours_old)
 
     async def refresh_freshness_scores(
         self,
@@ -308,13 +419,47 @@ class BreakingNewsDetector:
 
         Called periodically to update time-decay scores.
         """
-        for paper in papers:
-            paper.freshness_score = self.calculate_freshness(paper)
+        now = datetime.now(timezone.utc)
+        values = [
+            {"freshness_score": self.calculate_freshness(paper, now)}
+            for paper in papers
+        ]
 
         if db:
-            for paper in papers:
-                db.add(paper)
-            await db.commit()
+            await _bulk_update_papers(db, papers, values)
+        else:
+            for paper, row in zip(papers, values):
+                paper.freshness_score = row["freshness_score"]
+
+
+async def _bulk_update_papers(
+    db: AsyncSession,
+    papers: List[Paper],
+    values: List[dict],
+) -> None:
+    """Write per-paper column values with one executemany UPDATE and commit.
+
+    The same values are set on the instances as committed state, so the
+    session does not flush them again row by row.
+    """
+    if papers:
+        await db.execute(
+            update(Paper),
+            [{"id": paper.id, **row} for paper, row in zip(papers, values)],
+        )
+        for paper, row in zip(papers, values):
+            for key, value in row.items():
+                set_committed_value(paper, key, value)
+    await db.commit()
+
+
+# Built once from the class keyword lists: (domain keywords, universal
+# keywords) per domain, and universal keywords alone for other domains
+_DOMAIN_MATCHERS: Dict[str, _KeywordMatcher] = {
+    domain: _KeywordMatcher(keywords, BreakingNewsDetector.UNIVERSAL_KEYWORDS)
+    for domain, keywords in BreakingNewsDetector.BREAKING_KEYWORDS.items()
+}
+_UNIVERSAL_ONLY_MATCHER = _KeywordMatcher([], BreakingNewsDetector.UNIVERSAL_KEYWORDS)
 
 
 # Convenience function
@@ -330,13 +475,12 @@ async def detect_breaking_news(
         Dict with stats: {"total", "breaking_count", "results"}
     """
     detector = BreakingNewsDetector(breaking_threshold=threshold)
-    results = await detector.analyze_batch(papers, domain, db)
-
-    breaking_count = sum(1 for r in results if r.is_breaking)
+    batch = await detector.analyze_batch(papers, domain, db)
+    results = batch.results
 
     return {
         "total": len(results),
-        "breaking_count": breaking_count,
-        "breaking_rate": breaking_count / len(results) if results else 0,
+        "breaking_count": batch.breaking_count,
+        "breaking_rate": batch.breaking_count / len(results) if results else 0,
         "results": results,
     }
@@ -1,5 +1,8 @@
 """Service for creating and processing digests."""
+import asyncio
+import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -10,6 +13,22 @@ from app.ai.summarizer import Summarizer
 from app.ai.image_gen import ImageGenerator
 from app.analysis.credibility import CredibilityAnalyzer
 from app.services.domain_service import DomainService
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Image generation keeps no per-digest state; share one instance
+_image_gen = ImageGenerator()
+
+
+@lru_cache(maxsize=8)
+def _get_summarizer(provider: str, model: Optional[str]) -> Summarizer:
+    """Get a shared summarizer so SDK clients are reused across digests.
+
+    Keyed on provider and model only; the domain config is passed to each
+    call, since DomainService hands out a fresh instance every refresh.
+    """
+    return Summarizer(provider=provider, model=model)
 
 
 class DigestService:
@@ -78,39 +97,29 @@ class DigestService:
         await self.db.commit()
 
         try:
-            print(f"[Digest] Initializing services for digest {digest_id}")
+            logger.debug("Digest %s: initializing services", digest_id)
 
             # Get active domain configuration for context
             domain_service = DomainService(self.db)
             domain_config = await domain_service.get_active_domain()
 
-            # Initialize services with domain context
-            summarizer = Summarizer(
-                provider=digest.ai_provider,
-                model=digest.ai_model,
-                domain_config=domain_config,
-            )
-            image_gen = ImageGenerator()
+            # Initialize services; domain context is passed per call
+            summarizer = _get_summarizer(digest.ai_provider, digest.ai_model)
+            image_gen = _image_gen
+            # Holds this digest's session and weights, so never shared
             credibility = CredibilityAnalyzer(self.db)
 
-            print(f"[Digest] Loading {len(paper_ids)} papers")
-            # Get papers with authors eagerly loaded
-            papers = []
-            for paper_id in paper_ids:
-                result = await self.db.execute(
-                    select(Paper)
-                    .options(selectinload(Paper.authors))
-                    .where(Paper.id == paper_id)
-                )
-                paper = result.scalar_one_or_none()
-                if paper:
-                    papers.append(paper)
-                    print(f"[Digest] Loaded paper {paper_id}: {paper.title[:50]}")
-
-            print(f"[Digest] Processing {len(papers)} papers")
-            # Process each paper
-            for i, paper in enumerate(papers):
-                print(f"[Digest] Processing paper {i+1}/{len(papers)}: {paper.title[:50]}")
+            logger.debug("Digest %s: loading %s papers", digest_id, len(paper_ids))
+            # Get papers in one query, then restore digest order
+            result = await self.db.execute(
+                select(Paper).where(Paper.id.in_(paper_ids))
+            )
+            papers_by_id = {paper.id: paper for paper in result.scalars()}
+            papers = [papers_by_id[pid] for pid in paper_ids if pid in papers_by_id]
+
+            logger.debug("Digest %s: processing %s papers", digest_id, len(papers))
+
+            async def _analyze_credibility(paper: Paper):
                 # Analyze credibility if not done
                 if paper.credibility_score is None:
                     score, breakdown, note = await credibility.analyze(paper)
@@ -122,44 +131,73 @@ class DigestService:
                         provider=digest.ai_provider,
                         model=digest.ai_model
                     )
-                
+
+            async def _summarize_and_illustrate(paper: Paper):
                 # Generate summary if not done
                 if paper.summary_headline is None:
                     summary = await summarizer.summarize(
                         paper,
                         style=digest.summary_style,
+                        domain_config=domain_config,
                     )
                     paper.summary_headline = summary.headline
                     paper.summary_takeaway = summary.takeaway
                     paper.summary_why_matters = summary.why_matters
                     paper.key_takeaways = summary.key_takeaways
                     paper.tags = summary.tags
-                
-                # Generate image if not done
+
+                # Generate image if not done (the prompt uses the summary)
                 if paper.image_path is None:
                     image_path = await image_gen.generate(paper)
                     paper.image_path = image_path
-                
-                await self.db.commit()
+
+            semaphore = asyncio.Semaphore(settings.digest_ai_concurrency)
+
+            async def _process_paper(i: int, paper: Paper):
+                async with semaphore:
+                    logger.debug(
+                        "Digest %s: processing paper %s/%s (id %s)",
+                        digest_id, i + 1, len(papers), paper.id,
+                    )
+                    await asyncio.gather(
+                        _analyze_credibility(paper),
+                        _summarize_and_illustrate(paper),
+                    )
+
+            # The session is not safe for concurrent use: load the weights
+            # (the analyzer's only query) before the papers fan out
+            await credibility.load_weights()
+
+            # Papers run concurrently; wait for all of them before failing
+            # so no AI call is still writing to a paper at commit time
+            results = await asyncio.gather(
+                *[_process_paper(i, paper) for i, paper in enumerate(papers)],
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            await self.db.commit()
             
             # Generate intro, connecting narrative, and conclusion for digest
-            print(f"[Digest] Generating interconnected narrative...")
+            logger.debug("Digest %s: generating interconnected narrative", digest_id)
             intro, narrative, conclusion = await summarizer.generate_digest_texts(
                 papers,
                 digest.name,
+                domain_config=domain_config,
             )
             digest.intro_text = intro
             digest.connecting_narrative = narrative
             digest.conclusion_text = conclusion
 
             # Generate summary infographic for Final Thoughts section (Da Vinci style)
-            print(f"[Digest] Generating summary infographic...")
+            logger.debug("Digest %s: generating summary infographic", digest_id)
             summary_image_path = await image_gen.generate_summary_infographic(
                 papers,
                 digest.name,
             )
             digest.summary_image_path = summary_image_path
-            print(f"[Digest] Summary infographic saved: {summary_image_path}")
+            logger.debug("Digest %s: summary infographic saved to %s", digest_id, summary_image_path)
 
             digest.status = DigestStatus.COMPLETED
             digest.processed_at = datetime.utcnow()
@@ -173,15 +211,13 @@ class DigestService:
 
 async def execute_digest_background(digest_id: int):
     """Execute digest processing in background with a dedicated session."""
-    import traceback
     from app.core.database import async_session_maker
 
     try:
-        print(f"[Digest] Starting background processing for digest {digest_id}")
+        logger.debug("Digest %s: starting background processing", digest_id)
         async with async_session_maker() as session:
             service = DigestService(session)
             await service.process_digest(digest_id)
-        print(f"[Digest] Completed processing digest {digest_id}")
-    except Exception as e:
-        print(f"[Digest Error] Failed to process digest {digest_id}: {e}")
-        traceback.print_exc()
+        logger.debug("Digest %s: completed processing", digest_id)
+    except Exception:
+        logger.exception("Failed to process digest %s", digest_id)
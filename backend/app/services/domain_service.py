@@ -1,11 +1,24 @@
 """Domain configuration service."""
+import time
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.domain_config import DomainConfig, DEFAULT_DOMAINS
 from app.models.app_settings import AppSettings
 
+# The active domain is looked up by most requests (branding, AI prompts,
+# newsletters) but only changes when an admin switches it. Keep the loaded
+# row for a short while; other worker processes pick up a switch once their
+# entry expires
+DOMAIN_CACHE_TTL = 60  # seconds
+_active_domain_cache: dict[str, tuple[float, DomainConfig]] = {}
+
+
+def clear_domain_cache() -> None:
+    """Drop the cached active domain so the next lookup reloads it."""
+    _active_domain_cache.clear()
+
 
 class DomainService:
     """Service for managing domain configurations."""
@@ -14,7 +27,15 @@ class DomainService:
         self.db = db
 
     async def get_active_domain(self) -> DomainConfig:
-        """Get the currently active domain configuration."""
+        """Get the currently active domain configuration.
+
+        Cached for DOMAIN_CACHE_TTL seconds. The returned instance is
+        detached from any session and must be treated as read-only.
+        """
+        cached = _active_domain_cache.get("active")
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         # Get the active domain ID from settings
         settings = await self._get_or_create_settings()
         domain_id = settings.active_domain_id or "science"
@@ -28,6 +49,9 @@ class DomainService:
                 await self.seed_default_domains()
                 domain = await self.get_domain_by_id("science")
 
+        # Detach so the cached row is never tied to this request's session
+        self.db.expunge(domain)
+        _active_domain_cache["active"] = (time.monotonic() + DOMAIN_CACHE_TTL, domain)
         return domain
 
     async def get_domain_by_id(self, domain_id: str) -> Optional[DomainConfig]:
@@ -55,6 +79,7 @@ class DomainService:
         settings = await self._get_or_create_settings()
         settings.active_domain_id = domain_id
         await self.db.commit()
+        clear_domain_cache()
 
         return domain
 
@@ -64,14 +89,30 @@ class DomainService:
         return domain.to_branding_dict()
 
     async def seed_default_domains(self) -> None:
-        """Seed the database with default domain configurations."""
-        for domain_data in DEFAULT_DOMAINS:
-            existing = await self.get_domain_by_id(domain_data["domain_id"])
-            if not existing:
-                domain = DomainConfig(**domain_data)
-                self.db.add(domain)
+        """Seed the database with any missing default domain configurations."""
+        result = await self.db.execute(
+            select(DomainConfig.domain_id).where(
+                DomainConfig.domain_id.in_([d["domain_id"] for d in DEFAULT_DOMAINS])
+            )
+        )
+        existing = set(result.scalars())
+
+        # DEFAULT_DOMAINS is read-only; copy into plain dicts/lists for the insert
+        rows = [
+            {
+                **domain_data,
+                "enabled_sources": list(domain_data["enabled_sources"]),
+                "credibility_factors": dict(domain_data["credibility_factors"]),
+            }
+            for domain_data in DEFAULT_DOMAINS
+            if domain_data["domain_id"] not in existing
+        ]
+        if rows:
+            await self.db.execute(insert(DomainConfig), rows)
 
         await self.db.commit()
+        if rows:
+            clear_domain_cache()
 
     async def _get_or_create_settings(self) -> AppSettings:
         """Get or create application settings."""
@@ -2,7 +2,7 @@
 from typing import List, Optional
 import asyncio
 
-from sendgrid import SendGridAPIClient
+import httpx
 from sendgrid.helpers.mail import Mail, Email, To, Content, HtmlContent
 import smtplib
 from email.mime.text import MIMEText
@@ -14,11 +14,10 @@ from app.core.config import settings
 class EmailService:
     """Service for sending newsletter emails."""
     
+    SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+    
     def __init__(self):
         self.use_sendgrid = bool(settings.sendgrid_api_key)
-        
-        if self.use_sendgrid:
-            self.sg_client = SendGridAPIClient(settings.sendgrid_api_key)
     
     async def send_newsletter(
         self,
@@ -27,27 +26,40 @@ class EmailService:
         html_content: str,
         text_content: Optional[str] = None,
     ) -> List[dict]:
-        """Send newsletter to recipients."""
-        results = []
+        """Send newsletter to recipients.
         
-        for recipient in recipients:
-            try:
-                if self.use_sendgrid:
+        SendGrid recipients are sent to concurrently, at most
+        ``settings.email_max_concurrency`` at a time; SMTP recipients go out
+        over a single connection. Results keep the order of ``recipients``.
+        """
+        if not self.use_sendgrid:
+            return await self._send_via_smtp(
+                recipients, subject, html_content, text_content
+            )
+        
+        semaphore = asyncio.Semaphore(settings.email_max_concurrency)
+        
+        async def _send_one(recipient: str, client: httpx.AsyncClient) -> dict:
+            async with semaphore:
+                try:
                     await self._send_via_sendgrid(
-                        recipient, subject, html_content, text_content
+                        client, recipient, subject, html_content, text_content
                     )
-                else:
-                    await self._send_via_smtp(
-                        recipient, subject, html_content, text_content
-                    )
-                results.append({"email": recipient, "success": True})
-            except Exception as e:
-                results.append({"email": recipient, "success": False, "error": str(e)})
+                    return {"email": recipient, "success": True}
+                except Exception as e:
+                    return {"email": recipient, "success": False, "error": str(e)}
         
-        return results
+        # One pooled client for the batch; requests share its connections
+        async with httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {settings.sendgrid_api_key}"},
+            limits=httpx.Limits(max_connections=settings.email_max_concurrency),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        ) as client:
+            return await asyncio.gather(*[_send_one(r, client) for r in recipients])
     
     async def _send_via_sendgrid(
         self,
+        client: httpx.AsyncClient,
         recipient: str,
         subject: str,
         html_content: str,
@@ -64,25 +76,22 @@ class EmailService:
         if text_content:
             message.add_content(Content("text/plain", text_content))
         
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: self.sg_client.send(message)
-        )
+        # Post the v3 payload directly; the SDK client is blocking
+        response = await client.post(self.SENDGRID_SEND_URL, json=message.get())
+        response.raise_for_status()
     
     async def _send_via_smtp(
         self,
-        recipient: str,
+        recipients: List[str],
         subject: str,
         html_content: str,
         text_content: Optional[str],
-    ):
-        """Send email via SMTP."""
+    ) -> List[dict]:
+        """Send email to all recipients via SMTP."""
         msg = MIMEMultipart("alternative")
         msg["Subject"] = subject
         msg["From"] = settings.email_from
-        msg["To"] = recipient
+        msg["To"] = ""
         
         if text_content:
             msg.attach(MIMEText(text_content, "plain"))
@@ -91,15 +100,58 @@ class EmailService:
         
         # Run in executor to avoid blocking
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
+        return await loop.run_in_executor(
             None,
-            lambda: self._smtp_send(msg, recipient)
+            lambda: self._smtp_send_batch(msg, recipients)
         )
     
-    def _smtp_send(self, msg: MIMEMultipart, recipient: str):
-        """Synchronous SMTP send."""
-        with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
+    def _smtp_connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection with TLS started and login done."""
+        server = smtplib.SMTP(settings.smtp_host, settings.smtp_port)
+        try:
             server.starttls()
             if settings.smtp_user and settings.smtp_password:
                 server.login(settings.smtp_user, settings.smtp_password)
-            server.sendmail(settings.email_from, recipient, msg.as_string())
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _smtp_send_batch(self, msg: MIMEMultipart, recipients: List[str]) -> List[dict]:
+        """Synchronous SMTP send over one connection.
+        
+        The TLS handshake and login happen once for the whole batch; only
+        the To header changes between messages. If the server drops the
+        connection (e.g. a 421 after a per-connection message cap), it
+        reconnects and resends the current message once.
+        """
+        try:
+            server = self._smtp_connect()
+        except Exception as e:
+            return [{"email": r, "success": False, "error": str(e)} for r in recipients]
+        
+        results = []
+        try:
+            for recipient in recipients:
+                try:
+                    msg.replace_header("To", recipient)
+                    try:
+                        server.sendmail(settings.email_from, recipient, msg.as_string())
+                    except smtplib.SMTPException:
+                        # smtplib closes the socket when the connection is
+                        # lost or the server answers 421; anything else is a
+                        # per-recipient failure
+                        if server.sock is not None:
+                            raise
+                        server = self._smtp_connect()
+                        server.sendmail(settings.email_from, recipient, msg.as_string())
+                    results.append({"email": recipient, "success": True})
+                except Exception as e:
+                    results.append({"email": recipient, "success": False, "error": str(e)})
+        finally:
+            try:
+                server.quit()
+            except smtplib.SMTPException:
+                server.close()
+        
+        return results
@@ -1,26 +1,104 @@
 """Service for fetching papers from multiple sources."""
 import asyncio
+import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, or_, tuple_
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.paper import Paper, Author
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.paper import Paper
 from app.models.fetch_job import FetchJob, FetchStatus
 from app.models.custom_source import CustomSource
 from app.fetchers import get_fetcher, PaperData, register_custom_source
 from app.services.triage_service import TriageService
 from app.services.live_pulse_service import live_pulse_notifier
 
+logger = logging.getLogger(__name__)
+
+# (count, latest updated_at) of the active custom sources last loaded into
+# the fetcher registry; any add, edit or (de)activation changes it
+_custom_sources_version: Optional[Tuple[int, Optional[datetime]]] = None
+
+# source_id -> is_validated for the active custom sources, loaded with the
+# registry so papers are flagged without a query per batch or paper
+_custom_sources_validated: Dict[str, bool] = {}
+
+# Caps triage AI calls in flight across every source and job on the event
+# loop; created lazily because Celery tasks each run their own loop
+_triage_semaphore: Optional[asyncio.Semaphore] = None
+_triage_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_triage_semaphore() -> asyncio.Semaphore:
+    """The shared triage semaphore for the running event loop."""
+    global _triage_semaphore, _triage_semaphore_loop
+
+    loop = asyncio.get_running_loop()
+    if _triage_semaphore is None or _triage_semaphore_loop is not loop:
+        _triage_semaphore = asyncio.Semaphore(settings.triage_concurrency)
+        _triage_semaphore_loop = loop
+    return _triage_semaphore
+
+
+@dataclass(slots=True)
+class SourceFetchResult:
+    """Counts and errors from fetching a single source."""
+    fetched: int = 0
+    new: int = 0
+    updated: int = 0
+    triaged: int = 0
+    rejected: int = 0
+    errors: List[str] = field(default_factory=list)
+
 
 class FetchService:
     """Service for managing paper fetch operations."""
 
+    # Fetched papers are matched against stored papers and written in
+    # batches of up to this size, or whatever arrived within the wait
+    STORE_BATCH_SIZE = 50
+    STORE_BATCH_WAIT = 0.5  # seconds
+
+    # Fetched papers waiting to be written, per source
+    STORE_QUEUE_SIZE = 100
+
+    # Minimum job progress gain (percentage points) worth a commit
+    PROGRESS_COMMIT_STEP = 5
+
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Live notifications still being delivered
+        self._notify_tasks: Set[asyncio.Task] = set()
+
+    def _notify(self, paper: Paper, domain_id: Optional[str], event_type: str):
+        """Notify real-time listeners without holding up the writer."""
+        task = asyncio.create_task(
+            live_pulse_notifier.notify(paper, domain_id=domain_id, event_type=event_type)
+        )
+        # The set keeps a strong reference until the task is done
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
 
     async def _load_custom_sources(self):
-        """Load all custom sources into the fetcher registry."""
+        """Load all custom sources into the fetcher registry.
+
+        Skipped when the active sources are unchanged since the last load.
+        Also refreshes the validation flags used when storing papers.
+        """
+        global _custom_sources_version, _custom_sources_validated
+
+        result = await self.db.execute(
+            select(func.count(), func.max(CustomSource.updated_at))
+            .where(CustomSource.is_active == True)
+        )
+        version = tuple(result.one())
+        if version == _custom_sources_version:
+            return
+
         result = await self.db.execute(select(CustomSource).where(CustomSource.is_active == True))
         custom_sources = result.scalars().all()
 
@@ -32,9 +110,10 @@ class FetchService:
                 is_validated=cs.is_validated,
                 is_peer_reviewed=cs.is_peer_reviewed,
             )
-            print(f"[Fetch] Registered custom source: {cs.source_id}")
+            logger.debug("Registered custom source: %s", cs.source_id)
 
-        return custom_sources
+        _custom_sources_validated = {cs.source_id: cs.is_validated for cs in custom_sources}
+        _custom_sources_version = version
 
     async def start_fetch(
         self,
@@ -49,11 +128,12 @@ class FetchService:
             keywords=keywords,
             max_results=max_results,
             days_back=days_back,
-            status=FetchStatus.PENDING,
+            status=FetchStatus.PENDING.value,
         )
         self.db.add(job)
+        # The INSERT returns the id and started_at (eager_defaults), and
+        # commit does not expire the job, so no refresh SELECT is needed
         await self.db.commit()
-        await self.db.refresh(job)
         return job
     
     async def run_fetch(
@@ -70,6 +150,9 @@ class FetchService:
     ):
         """Execute the fetch operation.
 
+        Sources are fetched concurrently, each with its own session, so the
+        job takes about as long as its slowest source.
+
         Args:
             job_id: Fetch job ID
             sources: List of source IDs to fetch from
@@ -88,219 +171,418 @@ class FetchService:
         if not job:
             return
 
-        job.status = FetchStatus.RUNNING
+        job.status = FetchStatus.RUNNING.value
         await self.db.commit()
 
-        errors = []
-        papers_fetched = 0
-        papers_new = 0
-        papers_updated = 0
-        papers_triaged = 0
-        papers_rejected = 0
-
-        # Initialize triage service if enabled
-        triage_service = None
         if enable_triage:
-            triage_service = TriageService(
-                provider=triage_provider or "openai",
-                model=triage_model,
-                db=self.db
-            )
-            print(f"[Fetch] Triage enabled with {triage_provider or 'openai'}")
+            logger.info("Triage enabled with %s", triage_provider or "openai")
 
         # Load custom sources into registry
         await self._load_custom_sources()
 
         try:
-            # Fetch from each source
-            for i, source in enumerate(sources):
-                job.current_source = source
-                job.progress = int((i / len(sources)) * 100)
-                await self.db.commit()
+            pending = list(sources)
+            job.current_source = pending[0] if pending else None
+            progress_lock = asyncio.Lock()
+            committed_progress = job.progress
+
+            async def _run_source(source: str) -> SourceFetchResult:
+                nonlocal committed_progress
+
+                # A session is not safe for concurrent use, so every
+                # source writes through its own
+                async with async_session_maker() as session:
+                    source_result = await FetchService(session)._fetch_source(
+                        source,
+                        keywords=keywords,
+                        max_results=max_results // len(sources),
+                        days_back=days_back,
+                        enable_triage=enable_triage,
+                        triage_provider=triage_provider,
+                        triage_model=triage_model,
+                        domain_id=domain_id,
+                    )
 
-                try:
-                    fetcher = get_fetcher(source)
-                    print(f"[Fetch] Starting fetch from {source}...")
+                # The job row lives in this service's session; only one
+                # source at a time may report progress through it
+                async with progress_lock:
+                    pending.remove(source)
+                    job.current_source = pending[0] if pending else None
+                    job.progress = int(((len(sources) - len(pending)) / len(sources)) * 100)
+                    # Jobs with many sources only commit progress in
+                    # PROGRESS_COMMIT_STEP steps; the final status commit
+                    # below always lands
+                    if job.progress - committed_progress >= self.PROGRESS_COMMIT_STEP:
+                        await self.db.commit()
+                        committed_progress = job.progress
+
+                return source_result
+
+            source_results = await asyncio.gather(
+                *[_run_source(source) for source in sources],
+                return_exceptions=True,
+            )
 
-                    # Wrap fetch in a timeout to prevent hanging on slow sources
-                    try:
-                        async with asyncio.timeout(90):  # 90 second max per source
-                            async for paper_data in fetcher.fetch(
-                                keywords=keywords,
-                                max_results=max_results // len(sources),
-                                days_back=days_back,
-                            ):
-                                papers_fetched += 1
-                                print(f"[Fetch] Fetched paper: {paper_data.title[:50]}...")
-
-                                # Check if paper exists (by DOI or source_id)
-                                existing = await self._find_existing_paper(paper_data)
-
-                                if existing:
-                                    # Update existing paper
-                                    await self._update_paper(existing, paper_data, domain_id)
-                                    papers_updated += 1
-                                    print(f"[Fetch] Updated existing paper (ID: {existing.id})")
-
-                                    # Run triage on existing paper if enabled and not already triaged
-                                    if triage_service and existing.triage_status == "pending":
-                                        triage_result = await triage_service.triage_paper(existing)
-                                        papers_triaged += 1
-                                        if triage_result.verdict == "reject":
-                                            papers_rejected += 1
-                                            print(f"[Triage] Rejected: {triage_result.reason}")
-                                else:
-                                    # Create new paper
-                                    new_paper = await self._create_paper(paper_data, domain_id)
-                                    papers_new += 1
-                                    print(f"[Fetch] Created new paper (ID: {new_paper.id})")
-
-                                    # Run triage on new paper if enabled
-                                    if triage_service:
-                                        triage_result = await triage_service.triage_paper(new_paper)
-                                        papers_triaged += 1
-                                        if triage_result.verdict == "reject":
-                                            papers_rejected += 1
-                                            print(f"[Triage] Rejected: {triage_result.reason}")
-                                        else:
-                                            print(f"[Triage] Passed (score: {triage_result.quality_score:.2f})")
-                    except asyncio.TimeoutError:
-                        error_msg = f"{source}: Timed out after 90 seconds (skipping)"
-                        print(f"[Fetch Warning] {error_msg}")
-                        errors.append(error_msg)
-
-                except Exception as e:
-                    error_msg = f"{source}: {str(e)}"
-                    print(f"[Fetch Error] {error_msg}")
-                    import traceback
-                    traceback.print_exc()
-                    errors.append(error_msg)
+            totals = SourceFetchResult()
+            for source, source_result in zip(sources, source_results):
+                if isinstance(source_result, Exception):
+                    error_msg = f"{source}: {str(source_result)}"
+                    logger.error("Fetch failed for %s", source, exc_info=source_result)
+                    totals.errors.append(error_msg)
+                    continue
+                totals.fetched += source_result.fetched
+                totals.new += source_result.new
+                totals.updated += source_result.updated
+                totals.triaged += source_result.triaged
+                totals.rejected += source_result.rejected
+                totals.errors.extend(source_result.errors)
 
             # Update job status
-            job.status = FetchStatus.COMPLETED
-            job.papers_fetched = papers_fetched
-            job.papers_new = papers_new
-            job.papers_updated = papers_updated
-            job.errors = errors if errors else None
+            job.status = FetchStatus.COMPLETED.value
+            job.papers_fetched = totals.fetched
+            job.papers_new = totals.new
+            job.papers_updated = totals.updated
+            job.errors = totals.errors if totals.errors else None
             job.completed_at = datetime.now(timezone.utc)
             job.progress = 100
             job.current_source = None
 
             if enable_triage:
-                print(f"[Fetch] Triage summary: {papers_triaged} triaged, {papers_rejected} rejected")
+                logger.info("Triage summary: %s triaged, %s rejected", totals.triaged, totals.rejected)
 
         except Exception as e:
-            job.status = FetchStatus.FAILED
+            job.status = FetchStatus.FAILED.value
             job.errors = [str(e)]
             job.completed_at = datetime.now(timezone.utc)
 
         await self.db.commit()
-    
-    async def _find_existing_paper(self, paper_data: PaperData) -> Optional[Paper]:
-        """Find existing paper by DOI or source ID."""
-        # Try DOI first
-        if paper_data.doi:
-            result = await self.db.execute(
-                select(Paper).where(Paper.doi == paper_data.doi)
-            )
-            paper = result.scalar_one_or_none()
-            if paper:
-                return paper
-        
-        # Try source + source_id
-        result = await self.db.execute(
-            select(Paper).where(
-                Paper.source == paper_data.source,
-                Paper.source_id == paper_data.source_id
+
+    async def _fetch_source(
+        self,
+        source: str,
+        keywords: Optional[List[str]],
+        max_results: int,
+        days_back: int,
+        enable_triage: bool = False,
+        triage_provider: Optional[str] = None,
+        triage_model: Optional[str] = None,
+        domain_id: Optional[str] = None,
+    ) -> SourceFetchResult:
+        """Fetch one source and store its papers through this service's session."""
+        source_result = SourceFetchResult()
+
+        # Initialize triage service if enabled
+        triage_service = None
+        if enable_triage:
+            triage_service = TriageService(
+                provider=triage_provider or "openai",
+                model=triage_model,
+                db=self.db
             )
-        )
-        return result.scalar_one_or_none()
-    
-    async def _create_paper(self, paper_data: PaperData, domain_id: Optional[str] = None) -> Paper:
-        """Create a new paper from fetched data."""
+
         try:
-            paper = Paper(
-                title=paper_data.title,
-                abstract=paper_data.abstract,
-                journal=paper_data.journal,
-                doi=paper_data.doi,
-                url=paper_data.url,
-                source=paper_data.source,
-                source_id=paper_data.source_id,
-                published_date=paper_data.published_date,
-                citations=paper_data.citations,
-                influential_citations=paper_data.influential_citations,
-                altmetric_score=paper_data.altmetric_score,
-                journal_impact_factor=paper_data.journal_impact_factor,
-                is_peer_reviewed=paper_data.is_peer_reviewed,
-                is_preprint=paper_data.is_preprint,
-            )
+            fetcher = get_fetcher(source)
+            logger.info("Starting fetch from %s", source)
 
-            # Check if source is validated (custom sources start with 'custom_')
-            if paper_data.source.startswith("custom_"):
-                # Check custom source status in database
+            # The fetcher fills a bounded queue while batches are written
+            # from it, so network reads overlap with database writes; a
+            # full queue holds the fetcher back until the writer catches up
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.STORE_QUEUE_SIZE)
+
+            # Papers already queued, by DOI and by source ID; sources can
+            # return the same paper more than once (e.g. several versions)
+            seen_dois = set()
+            seen_source_ids = set()
+
+            async def _produce():
                 try:
-                    result = await self.db.execute(
-                        select(CustomSource).where(CustomSource.source_id == paper_data.source)
-                    )
-                    source = result.scalar_one_or_none()
-                    if source and source.is_validated:
-                        paper.is_validated_source = True
-                        print(f"[Fetch] Paper from validated source: {source.name}")
-                except Exception as e:
-                    print(f"[Fetch Warning] Failed to check source validation: {e}")
-
-            # Add authors
-            for author_data in paper_data.authors:
-                author = Author(
-                    name=author_data.name,
-                    affiliation=author_data.affiliation,
-                    h_index=author_data.h_index,
-                    semantic_scholar_id=author_data.semantic_scholar_id,
+                    # Wrap fetch in a timeout to prevent hanging on slow sources
+                    async with asyncio.timeout(90):  # 90 second max per source
+                        async for paper_data in fetcher.fetch(
+                            keywords=keywords,
+                            max_results=max_results,
+                            days_back=days_back,
+                        ):
+                            source_result.fetched += 1
+                            logger.debug("Fetched paper from %s: %s", source, paper_data.source_id)
+
+                            # Repeats would only re-match and rewrite the same row
+                            if paper_data.doi in seen_dois or paper_data.source_id in seen_source_ids:
+                                continue
+                            if paper_data.doi:
+                                seen_dois.add(paper_data.doi)
+                            seen_source_ids.add(paper_data.source_id)
+
+                            await queue.put(paper_data)
+                except asyncio.TimeoutError:
+                    error_msg = f"{source}: Timed out after 90 seconds (skipping)"
+                    logger.warning(error_msg)
+                    source_result.errors.append(error_msg)
+                finally:
+                    # End of stream, unless the writer failed and cancelled us
+                    if not asyncio.current_task().cancelling():
+                        await queue.put(None)
+
+            producer = asyncio.create_task(_produce())
+            try:
+                # Papers queued before a timeout are still stored
+                done = False
+                while not done:
+                    batch, done = await self._next_batch(queue)
+                    if batch:
+                        await self._store_batch(batch, source_result, triage_service, domain_id)
+            finally:
+                producer.cancel()
+            # Surface fetch errors once everything fetched has been stored
+            await producer
+
+        except Exception as e:
+            error_msg = f"{source}: {str(e)}"
+            logger.exception("Fetch failed for %s", source)
+            source_result.errors.append(error_msg)
+
+        # Let notifications finish before the caller closes the session
+        await asyncio.gather(*self._notify_tasks, return_exceptions=True)
+
+        return source_result
+    
+    async def _next_batch(self, queue: asyncio.Queue) -> Tuple[List[PaperData], bool]:
+        """Take the next batch of fetched papers from the queue.
+
+        Waits for a first paper, then collects more until the batch is full
+        or ``STORE_BATCH_WAIT`` seconds have passed.
+
+        Returns:
+            The batch, and whether the end of the stream was reached
+        """
+        paper_data = await queue.get()
+        if paper_data is None:
+            return [], True
+
+        batch = [paper_data]
+        deadline = asyncio.get_running_loop().time() + self.STORE_BATCH_WAIT
+        while len(batch) < self.STORE_BATCH_SIZE:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                paper_data = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if paper_data is None:
+                return batch, True
+            batch.append(paper_data)
+
+        return batch, False
+
+    async def _store_batch(
+        self,
+        batch: List[PaperData],
+        source_result: SourceFetchResult,
+        triage_service: Optional[TriageService] = None,
+        domain_id: Optional[str] = None,
+    ):
+        """Create or update a batch of fetched papers."""
+        by_doi, by_source_id = await self._find_existing_papers(batch)
+        updated, update_rows, new_papers = self._match_existing(batch, by_doi, by_source_id)
+
+        # Create all new papers with one INSERT
+        created = await self._create_papers(new_papers) if new_papers else []
+
+        # The INSERT skips papers another fetch stored since the lookup
+        # above (e.g. a concurrent source sharing DOIs); look them up again
+        # and apply them as updates so they are counted, notified and triaged
+        if len(created) < len(new_papers):
+            created_keys = {(paper.source, paper.source_id) for paper in created}
+            skipped = [
+                paper_data for paper_data in new_papers
+                if (paper_data.source, paper_data.source_id) not in created_keys
+            ]
+            by_doi, by_source_id = await self._find_existing_papers(skipped)
+            late_updated, late_rows, unresolved = self._match_existing(skipped, by_doi, by_source_id)
+            updated += late_updated
+            update_rows += late_rows
+            if unresolved:
+                logger.warning(
+                    "%d fetched papers were neither inserted nor found", len(unresolved)
                 )
-                paper.authors.append(author)
 
-            self.db.add(paper)
-            await self.db.commit()
-            await self.db.refresh(paper)
+        # Write all updates with one executemany UPDATE by primary key
+        if update_rows:
+            await self.db.execute(update(Paper), update_rows)
 
+        # One commit for the whole batch; listeners hear about papers only
+        # once they are committed
+        await self.db.commit()
+
+        source_result.updated += len(updated)
+        for paper in updated:
+            logger.debug("Updated existing paper (ID: %s)", paper.id)
             # Notify real-time listeners including domain context
-            await live_pulse_notifier.notify(paper, domain_id=domain_id, event_type="new_item")
+            self._notify(paper, domain_id, "updated")
 
-            return paper
-        except Exception as e:
-            print(f"[Fetch Error] Failed to create paper: {e}")
-            import traceback
-            traceback.print_exc()
+        source_result.new += len(created)
+        for paper in created:
+            logger.debug("Created new paper (ID: %s)", paper.id)
+            self._notify(paper, domain_id, "new_item")
+
+        if not triage_service:
+            return
+
+        # Run triage on existing papers not already triaged and on new
+        # papers; the AI calls overlap, bounded by the semaphore shared with
+        # every other source being fetched
+        to_triage = [paper for paper in updated if paper.triage_status == "pending"] + created
+        semaphore = _get_triage_semaphore()
+
+        async def _triage(paper: Paper):
+            async with semaphore:
+                # Only sets the paper's fields; committed below
+                return await triage_service.triage_paper(paper, commit=False)
+
+        triage_results = await asyncio.gather(*[_triage(paper) for paper in to_triage])
+        await self.db.commit()
+
+        for paper, triage_result in zip(to_triage, triage_results):
+            source_result.triaged += 1
+            if triage_result.verdict == "reject":
+                source_result.rejected += 1
+                logger.debug("Triage rejected paper %s: %s", paper.id, triage_result.reason)
+            else:
+                logger.debug("Triage passed paper %s (score: %.2f)", paper.id, triage_result.quality_score)
+
+    def _match_existing(
+        self,
+        batch: List[PaperData],
+        by_doi: Dict[str, Paper],
+        by_source_id: Dict[Tuple[str, str], Paper],
+    ) -> Tuple[List[Paper], List[dict], List[PaperData]]:
+        """Split a batch into stored papers to update and papers to create.
+
+        Returns:
+            The matched papers, their UPDATE rows (by primary key) and the
+            fetched papers with no stored match
+        """
+        updated: List[Paper] = []
+        update_rows: List[dict] = []
+        new_papers: List[PaperData] = []
+
+        for paper_data in batch:
+            # Match by DOI first, then by source + source_id
+            existing = by_doi.get(paper_data.doi) if paper_data.doi else None
+            if existing is None:
+                existing = by_source_id.get((paper_data.source, paper_data.source_id))
+
+            if existing:
+                # Update existing paper
+                values = self._update_values(existing, paper_data)
+                if values:
+                    update_rows.append({"id": existing.id, **values})
+                    # Keep the loaded paper current without marking it
+                    # dirty, so the session won't flush it again
+                    for key, value in values.items():
+                        set_committed_value(existing, key, value)
+                updated.append(existing)
+            else:
+                new_papers.append(paper_data)
+
+        return updated, update_rows, new_papers
+
+    async def _find_existing_papers(
+        self, batch: List[PaperData]
+    ) -> Tuple[Dict[str, Paper], Dict[Tuple[str, str], Paper]]:
+        """Find stored papers matching a batch by DOI or source ID in one query.
+
+        Returns:
+            Papers keyed by DOI and by (source, source_id)
+        """
+        dois = {paper_data.doi for paper_data in batch if paper_data.doi}
+        source_ids = {(paper_data.source, paper_data.source_id) for paper_data in batch}
+
+        conditions = [tuple_(Paper.source, Paper.source_id).in_(source_ids)]
+        if dois:
+            conditions.append(Paper.doi.in_(dois))
+        by_doi: Dict[str, Paper] = {}
+        by_source_id: Dict[Tuple[str, str], Paper] = {}
+        # Stream matches into the maps instead of buffering the whole
+        # result first
+        async for paper in await self.db.stream_scalars(select(Paper).where(or_(*conditions))):
+            if paper.doi:
+                by_doi[paper.doi] = paper
+            by_source_id[(paper.source, paper.source_id)] = paper
+        return by_doi, by_source_id
+    
+    async def _create_papers(self, paper_datas: List[PaperData]) -> List[Paper]:
+        """Create new papers from fetched data in one INSERT.
+
+        Papers another fetch stored in the meantime are skipped. Runs in the
+        caller's transaction (no commit).
+
+        Returns:
+            The created papers
+        """
+        try:
+            rows = [
+                {
+                    "title": paper_data.title,
+                    "abstract": paper_data.abstract,
+                    "journal": paper_data.journal,
+                    "doi": paper_data.doi,
+                    "url": paper_data.url,
+                    "source": paper_data.source,
+                    "source_id": paper_data.source_id,
+                    "published_date": paper_data.published_date,
+                    "citations": paper_data.citations,
+                    "influential_citations": paper_data.influential_citations,
+                    "altmetric_score": paper_data.altmetric_score,
+                    "journal_impact_factor": paper_data.journal_impact_factor,
+                    "is_peer_reviewed": paper_data.is_peer_reviewed,
+                    "is_preprint": paper_data.is_preprint,
+                    "is_validated_source": False,
+                    "authors": [
+                        {
+                            "name": author_data.name,
+                            "affiliation": author_data.affiliation,
+                            "h_index": author_data.h_index,
+                            "semantic_scholar_id": author_data.semantic_scholar_id,
+                        }
+                        for author_data in paper_data.authors
+                    ],
+                }
+                for paper_data in paper_datas
+            ]
+
+            # Check if source is validated (custom sources start with 'custom_')
+            for row in rows:
+                if row["source"].startswith("custom_"):
+                    row["is_validated_source"] = _custom_sources_validated.get(row["source"], False)
+
+            return await Paper.bulk_insert_new(self.db, rows)
+        except Exception:
+            logger.exception("Failed to create papers")
             await self.db.rollback()
             raise
     
-    async def _update_paper(self, paper: Paper, paper_data: PaperData, domain_id: Optional[str] = None):
-        """Update existing paper with new data."""
+    def _update_values(self, paper: Paper, paper_data: PaperData) -> dict:
+        """Column values to update on an existing paper from refetched data."""
         # Update fields that might have changed
-        if paper_data.citations is not None:
-            paper.citations = paper_data.citations
-        if paper_data.influential_citations is not None:
-            paper.influential_citations = paper_data.influential_citations
-        if paper_data.altmetric_score is not None:
-            paper.altmetric_score = paper_data.altmetric_score
+        values = {
+            key: value
+            for key, value in (
+                ("citations", paper_data.citations),
+                ("influential_citations", paper_data.influential_citations),
+                ("altmetric_score", paper_data.altmetric_score),
+            )
+            if value is not None
+        }
         
         # Check source validation update (in case source changed status)
         if paper.source == "custom" and hasattr(paper_data, "source_id") and paper_data.source_id:
-             try:
-                 result = await self.db.execute(
-                     select(CustomSource).where(CustomSource.source_id == paper_data.source_id)
-                 )
-                 source = result.scalar_one_or_none()
-                 if source:
-                     paper.is_validated_source = source.is_validated
-             except Exception:
-                 pass
-        
-        await self.db.commit()
-        
-        # Notify real-time listeners including domain context
-        await live_pulse_notifier.notify(paper, domain_id=domain_id, event_type="updated")
+            is_validated = _custom_sources_validated.get(paper_data.source_id)
+            if is_validated is not None:
+                values["is_validated_source"] = is_validated
+
+        return values
     
     async def get_status(self, job_id: int) -> dict:
         """Get fetch job status."""
@@ -312,7 +594,7 @@ class FetchService:
         
         return {
             "job_id": job.id,
-            "status": job.status.value,
+            "status": job.status,
             "progress": job.progress,
             "current_source": job.current_source,
             "papers_fetched": job.papers_fetched,
@@ -348,8 +630,6 @@ async def execute_fetch_background(
         triage_model: Specific model for triage
         domain_id: Domain context
     """
-    from app.core.database import async_session_maker
-
     async with async_session_maker() as session:
         service = FetchService(session)
         await service.run_fetch(
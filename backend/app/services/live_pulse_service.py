@@ -6,11 +6,12 @@ and freshness scoring.
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Set
 
-from sqlalchemy import select, and_, or_
+import orjson
+from sqlalchemy import select, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.paper import Paper
 from app.services.breaking_detector import BreakingNewsDetector
@@ -65,7 +66,7 @@ class LivePulseService:
         Returns:
             List of papers sorted by importance
         """
-        query = select(Paper).options(selectinload(Paper.authors))
+        query = select(Paper)
 
         conditions = []
 
@@ -119,9 +120,16 @@ class LivePulseService:
         result = await self.db.execute(query)
         papers = list(result.scalars().all())
 
-        # Update freshness scores on retrieved papers
+        # Refresh freshness scores for the response only; setting them as
+        # committed values keeps the papers clean, so the request's session
+        # never flushes an UPDATE for every row it served
+        now = datetime.now(timezone.utc)
         for paper in papers:
-            paper.freshness_score = self.breaking_detector.calculate_freshness(paper)
+            set_committed_value(
+                paper,
+                "freshness_score",
+                self.breaking_detector.calculate_freshness(paper, now),
+            )
 
         return papers
 
@@ -143,7 +151,7 @@ class LivePulseService:
         """
         cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
 
-        query = select(Paper).options(selectinload(Paper.authors)).where(
+        query = select(Paper).where(
             and_(
                 Paper.is_breaking == True,
                 Paper.fetched_at >= cutoff
@@ -172,37 +180,18 @@ class LivePulseService:
         """
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours_back)
 
-        # Total papers
-        total_query = select(Paper).where(Paper.fetched_at >= cutoff)
-        total_result = await self.db.execute(total_query)
-        total_papers = len(list(total_result.scalars().all()))
-
-        # Breaking papers
-        breaking_query = select(Paper).where(
-            and_(
-                Paper.fetched_at >= cutoff,
-                Paper.is_breaking == True
-            )
-        )
-        breaking_result = await self.db.execute(breaking_query)
-        breaking_count = len(list(breaking_result.scalars().all()))
-
-        # Passed triage
-        passed_query = select(Paper).where(
-            and_(
-                Paper.fetched_at >= cutoff,
-                Paper.triage_status == "passed"
-            )
-        )
-        passed_result = await self.db.execute(passed_query)
-        passed_count = len(list(passed_result.scalars().all()))
-
-        # Average freshness
-        recent_papers = await self.get_feed(limit=50, passed_triage_only=False)
-        avg_freshness = (
-            sum(p.freshness_score or 0 for p in recent_papers) / len(recent_papers)
-            if recent_papers else 0
+        # Every stat in one round trip: total, breaking and passed-triage
+        # counts and the average freshness over the window
+        result = await self.db.execute(
+            select(
+                func.count(),
+                func.count().filter(Paper.is_breaking == True),
+                func.count().filter(Paper.triage_status == "passed"),
+                func.avg(func.coalesce(Paper.freshness_score, 0)),
+            ).where(Paper.fetched_at >= cutoff)
         )
+        total_papers, breaking_count, passed_count, avg_freshness = result.one()
+        avg_freshness = float(avg_freshness or 0)
 
         return {
             "time_window_hours": hours_back,
@@ -235,29 +224,42 @@ class LivePulseService:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours_back)
 
         query = select(Paper).where(Paper.fetched_at >= cutoff)
-        result = await self.db.execute(query)
-        papers = list(result.scalars().all())
 
         updated_count = 0
         new_breaking_count = 0
+        now = datetime.now(timezone.utc)
 
-        for paper in papers:
-            old_is_breaking = paper.is_breaking
+        # Stream the window batch_size papers at a time; each batch is
+        # flushed and released before the next is loaded, so memory stays
+        # bounded by the batch rather than the window
+        result = await self.db.stream_scalars(
+            query.execution_options(yield_per=batch_size)
+        )
+        async for papers in result.partitions():
+            for paper in papers:
+                old_is_breaking = paper.is_breaking
 
-            # Re-analyze for breaking news
-            analysis = await self.breaking_detector.analyze(paper, domain_id or "news")
+                # Re-analyze for breaking news
+                analysis = self.breaking_detector.score(paper, domain_id or "news", now)
 
-            # Update paper
-            paper.is_breaking = analysis.is_breaking
-            paper.breaking_score = analysis.score
-            paper.breaking_keywords = analysis.keywords_found if analysis.keywords_found else None
-            paper.freshness_score = self.breaking_detector.calculate_freshness(paper)
+                # Update paper
+                paper.is_breaking = analysis.is_breaking
+                paper.breaking_score = analysis.score
+                paper.breaking_keywords = analysis.keywords_found if analysis.keywords_found else None
+                paper.freshness_score = self.breaking_detector.calculate_freshness(paper, now)
 
-            self.db.add(paper)
-            updated_count += 1
+                updated_count += 1
 
-            if analysis.is_breaking and not old_is_breaking:
-                new_breaking_count += 1
+                if analysis.is_breaking and not old_is_breaking:
+                    new_breaking_count += 1
+
+            # Committing would close the open cursor, so flush and let go
+            # of this batch instead; one commit covers the whole window.
+            # Only this batch is expunged: expunge_all() would swap out the
+            # identity map the streaming result is still loading into
+            await self.db.flush()
+            for paper in papers:
+                self.db.expunge(paper)
 
         await self.db.commit()
 
@@ -296,7 +298,7 @@ class LivePulseService:
                 )
             )
 
-        query = select(Paper).options(selectinload(Paper.authors)).where(
+        query = select(Paper).where(
             and_(*conditions)
         ).order_by(Paper.fetched_at.desc())
 
@@ -307,15 +309,15 @@ class LivePulseService:
 class LivePulseNotifier:
     """Manages real-time notifications for Live Pulse.
 
-    Maintains a list of connected clients (WebSocket connections)
+    Maintains a set of connected clients (WebSocket connections)
     and broadcasts updates when new items arrive.
     """
 
     def __init__(self):
         """Initialize notifier."""
-        # Domain -> List of callback functions
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._global_subscribers: List[Callable] = []
+        # Domain -> Set of callback functions
+        self._subscribers: Dict[str, Set[Callable]] = {}
+        self._global_subscribers: Set[Callable] = set()
 
     def subscribe(
         self,
@@ -325,15 +327,14 @@ class LivePulseNotifier:
         """Subscribe to updates.
 
         Args:
-            callback: Async function to call with new items
+            callback: Async function called with each message, already
+                serialized to JSON bytes
             domain_id: Domain to subscribe to (None for all)
         """
         if domain_id:
-            if domain_id not in self._subscribers:
-                self._subscribers[domain_id] = []
-            self._subscribers[domain_id].append(callback)
+            self._subscribers.setdefault(domain_id, set()).add(callback)
         else:
-            self._global_subscribers.append(callback)
+            self._global_subscribers.add(callback)
 
     def unsubscribe(
         self,
@@ -342,13 +343,9 @@ class LivePulseNotifier:
     ):
         """Unsubscribe from updates."""
         if domain_id and domain_id in self._subscribers:
-            self._subscribers[domain_id] = [
-                cb for cb in self._subscribers[domain_id] if cb != callback
-            ]
+            self._subscribers[domain_id].discard(callback)
         else:
-            self._global_subscribers = [
-                cb for cb in self._global_subscribers if cb != callback
-            ]
+            self._global_subscribers.discard(callback)
 
     async def notify(
         self,
@@ -379,20 +376,25 @@ class LivePulseNotifier:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        # Notify domain-specific subscribers
+        # Serialize once; every subscriber receives the same bytes instead
+        # of re-encoding the dict per connection
+        payload = orjson.dumps(message)
+
+        # Snapshot the subscribers: a callback may unsubscribe while the
+        # fan-out is in flight, and a set cannot change size mid-iteration
+        callbacks = list(self._global_subscribers)
         if domain_id and domain_id in self._subscribers:
-            for callback in self._subscribers[domain_id]:
-                try:
-                    await callback(message)
-                except Exception as e:
-                    logger.error(f"Error notifying subscriber: {e}")
-
-        # Notify global subscribers
-        for callback in self._global_subscribers:
-            try:
-                await callback(message)
-            except Exception as e:
-                logger.error(f"Error notifying global subscriber: {e}")
+            callbacks.extend(self._subscribers[domain_id])
+
+        # Dispatch to every subscriber at once so one slow client does not
+        # hold up the rest; failures are collected rather than raised
+        results = await asyncio.gather(
+            *(callback(payload) for callback in callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error notifying subscriber: %s", result)
 
     async def notify_breaking(self, paper: Paper, domain_id: Optional[str] = None):
         """Send breaking news alert."""
@@ -22,23 +22,33 @@ class ExtractedPaper:
 class PdfExtractor:
     """Extract text and metadata from PDF files."""
     
-    def __init__(self):
-        self.title_patterns = [
+    # Patterns are compiled once, with their flags, when the class loads
+    TITLE_PATTERNS = [
+        re.compile(p, re.MULTILINE) for p in (
             # Common title patterns at start of document
             r'^([A-Z][^\n]{20,200})$',  # Capitalized line 20-200 chars
             r'^Title:\s*(.+)$',
             r'^(.{20,200})\n\n',  # First substantial line followed by blank
-        ]
-        
-        self.abstract_patterns = [
+        )
+    ]
+    
+    ABSTRACT_PATTERNS = [
+        re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
             r'(?:Abstract|ABSTRACT)[:\s]*\n?(.*?)(?:\n\n|\nIntroduction|\nKeywords|\n1\.)',
             r'(?:Summary|SUMMARY)[:\s]*\n?(.*?)(?:\n\n|\nIntroduction)',
-        ]
-        
-        self.author_patterns = [
+        )
+    ]
+    
+    AUTHOR_PATTERNS = [
+        re.compile(p, re.MULTILINE) for p in (
             r'(?:Authors?|By)[:\s]*([^\n]+)',
             r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)*)',
-        ]
+        )
+    ]
+    
+    HEADER_SKIP_PATTERN = re.compile(r'^(Page|Vol\.|Issue|Journal|ISSN|DOI)', re.I)
+    AUTHOR_SPLIT_PATTERN = re.compile(r'[,;]|and|\s+&\s+')
+    WHITESPACE_PATTERN = re.compile(r'\s+')
     
     def extract(self, file_path: str | Path) -> ExtractedPaper:
         """Extract text and metadata from a PDF file."""
@@ -95,7 +105,7 @@ class PdfExtractor:
             line = line.strip()
             if len(line) >= 20 and len(line) <= 300:
                 # Skip common header patterns
-                if not re.match(r'^(Page|Vol\.|Issue|Journal|ISSN|DOI)', line, re.I):
+                if not self.HEADER_SKIP_PATTERN.match(line):
                     return line
         
         # Last resort: first 100 chars
@@ -103,12 +113,12 @@ class PdfExtractor:
     
     def _extract_abstract(self, text: str) -> Optional[str]:
         """Extract abstract from text."""
-        for pattern in self.abstract_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in self.ABSTRACT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 abstract = match.group(1).strip()
                 # Clean up and limit length
-                abstract = re.sub(r'\s+', ' ', abstract)
+                abstract = self.WHITESPACE_PATTERN.sub(' ', abstract)
                 if len(abstract) > 50:
                     return abstract[:2000]
         
@@ -122,7 +132,7 @@ class PdfExtractor:
                 break
         
         remaining = '\n'.join(lines[content_start:content_start + 20])
-        remaining = re.sub(r'\s+', ' ', remaining).strip()
+        remaining = self.WHITESPACE_PATTERN.sub(' ', remaining).strip()
         
         if len(remaining) > 100:
             return remaining[:500]
@@ -137,7 +147,7 @@ class PdfExtractor:
         if reader.metadata and reader.metadata.author:
             author_str = reader.metadata.author
             # Split by common delimiters
-            for author in re.split(r'[,;]|and|\s+&\s+', author_str):
+            for author in self.AUTHOR_SPLIT_PATTERN.split(author_str):
                 author = author.strip()
                 if author and len(author) > 2:
                     authors.append(author)
@@ -146,11 +156,11 @@ class PdfExtractor:
             return authors[:10]  # Limit to 10 authors
         
         # Try text patterns
-        for pattern in self.author_patterns:
-            match = re.search(pattern, text[:2000], re.MULTILINE)
+        for pattern in self.AUTHOR_PATTERNS:
+            match = pattern.search(text[:2000])
             if match:
                 author_str = match.group(1)
-                for author in re.split(r'[,;]|and|\s+&\s+', author_str):
+                for author in self.AUTHOR_SPLIT_PATTERN.split(author_str):
                     author = author.strip()
                     if author and len(author) > 2 and len(author) < 50:
                         authors.append(author)
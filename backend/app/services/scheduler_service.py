@@ -3,6 +3,7 @@
 Uses APScheduler for cron-based scheduling of digest generation.
 """
 import logging
+import traceback
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
@@ -228,7 +229,6 @@ class DigestScheduler:
 
             except Exception as e:
                 logger.error(f"Failed to execute scheduled digest {schedule_id}: {e}")
-                import traceback
                 traceback.print_exc()
 
                 # Update schedule with error
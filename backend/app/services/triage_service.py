@@ -97,13 +97,17 @@ Criteria:
     async def triage_paper(
         self,
         paper: Paper,
-        domain_config: Optional[DomainConfig] = None
+        domain_config: Optional[DomainConfig] = None,
+        commit: bool = True
     ) -> TriageResult:
         """Evaluate a single paper through triage.
 
         Args:
             paper: Paper to evaluate
             domain_config: Domain configuration for context
+            commit: Commit the paper's triage fields; when False they are
+                only set on the paper, so several papers can be triaged
+                concurrently and committed together by the caller
 
         Returns:
             TriageResult with evaluation
@@ -139,7 +143,7 @@ Criteria:
 
             # Update paper if we have a db session
             if self.db:
-                await self._update_paper(paper, result)
+                await self._update_paper(paper, result, commit)
 
             return result
 
@@ -223,7 +227,7 @@ Criteria:
                 reason=f"Parse error (auto-passed): {str(e)[:50]}"
             )
 
-    async def _update_paper(self, paper: Paper, result: TriageResult) -> None:
+    async def _update_paper(self, paper: Paper, result: TriageResult, commit: bool = True) -> None:
         """Update paper with triage results."""
         paper.triage_status = "passed" if result.verdict == "pass" else "rejected"
         paper.triage_score = result.quality_score
@@ -231,7 +235,7 @@ Criteria:
         paper.triage_model = f"{self.provider_name}/{self.model}"
         paper.triaged_at = datetime.utcnow()
 
-        if self.db:
+        if self.db and commit:
             self.db.add(paper)
             await self.db.commit()
 
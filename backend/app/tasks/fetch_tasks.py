@@ -1,7 +1,7 @@
 """Background tasks for paper fetching."""
 import asyncio
 from app.celery_app import celery_app
-from app.core.database import async_session_maker
+from app.core.database import async_session_maker, engine
 from app.services.fetch_service import FetchService
 
 
@@ -15,15 +15,20 @@ def fetch_papers_task(
 ):
     """Background task to fetch papers from sources."""
     async def _run():
-        async with async_session_maker() as session:
-            service = FetchService(session)
-            await service.run_fetch(
-                job_id=job_id,
-                sources=sources,
-                keywords=keywords,
-                max_results=max_results,
-                days_back=days_back,
-            )
+        try:
+            async with async_session_maker() as session:
+                service = FetchService(session)
+                await service.run_fetch(
+                    job_id=job_id,
+                    sources=sources,
+                    keywords=keywords,
+                    max_results=max_results,
+                    days_back=days_back,
+                )
+        finally:
+            # Pooled asyncpg connections are bound to this task's event
+            # loop, which asyncio.run closes on return
+            await engine.dispose()
     
     asyncio.run(_run())
 
@@ -31,11 +36,16 @@ def fetch_papers_task(
 @celery_app.task(name="process_digest")
 def process_digest_task(digest_id: int):
     """Background task to process a digest."""
-    from app.services.digest_service import DigestService
+    from app.services.digest_service import DigestService, _get_summarizer
     
     async def _run():
-        async with async_session_maker() as session:
-            service = DigestService(session)
-            await service.process_digest(digest_id)
+        try:
+            async with async_session_maker() as session:
+                service = DigestService(session)
+                await service.process_digest(digest_id)
+        finally:
+            await engine.dispose()
+            # Cached summarizers hold SDK clients bound to this loop too
+            _get_summarizer.cache_clear()
     
     asyncio.run(_run())
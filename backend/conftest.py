@@ -0,0 +1,28 @@
+"""Shared fixtures for the backend tests."""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base
+
+
+@pytest.fixture
+def session_maker(tmp_path):
+    """Session factory for a throwaway SQLite database with all tables created.
+
+    NullPool opens a connection per session, so the factory works from any
+    event loop: each test's asyncio.run() or a TestClient's portal.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool
+    )
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    asyncio.run(engine.dispose())
@@ -15,7 +15,7 @@ import asyncio
 import uvicorn
 from app.core.database import init_db, async_session_maker
 from app.demo.mock_data import get_mock_papers, get_mock_summary, get_mock_credibility
-from app.models.paper import Paper, Author
+from app.models.paper import Paper
 from app.models.digest import Digest, DigestPaper, DigestStatus
 from datetime import datetime
 from sqlalchemy import select
@@ -62,12 +62,10 @@ async def seed_demo_data():
                 credibility_note=note,
             )
             
-            for author_name in paper_data.get("authors", []):
-                author = Author(
-                    name=author_name,
-                    h_index=50 + hash(author_name) % 30,
-                )
-                paper.authors.append(author)
+            paper.authors = [
+                {"name": author_name, "h_index": 50 + hash(author_name) % 30}
+                for author_name in paper_data.get("authors", [])
+            ]
             
             db.add(paper)
             papers.append(paper)
@@ -14,7 +14,7 @@ os.environ["DEFAULT_AI_MODEL"] = "llama-3.3-70b-versatile"
 from datetime import datetime
 from app.core.database import init_db, async_session_maker
 from app.fetchers.arxiv import ArxivFetcher
-from app.models.paper import Paper, Author
+from app.models.paper import Paper
 from app.analysis.credibility import CredibilityAnalyzer
 from app.ai.summarizer import Summarizer
 from app.ai.providers.base import get_ai_provider
@@ -61,12 +61,10 @@ async def save_papers_to_db(papers_data, db):
         )
         
         # Add authors
-        for author_data in paper_data.authors[:5]:  # Limit to first 5 authors
-            author = Author(
-                name=author_data.name,
-                affiliation=author_data.affiliation,
-            )
-            paper.authors.append(author)
+        paper.authors = [
+            {"name": author_data.name, "affiliation": author_data.affiliation}
+            for author_data in paper_data.authors[:5]  # Limit to first 5 authors
+        ]
         
         db.add(paper)
         saved_papers.append(paper)
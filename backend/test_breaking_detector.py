@@ -0,0 +1,63 @@
+"""Breaking news keyword matching tests."""
+import random
+
+from app.services.breaking_detector import (
+    BreakingNewsDetector,
+    _DOMAIN_MATCHERS,
+    _KeywordMatcher,
+)
+
+
+def substring_hits(keywords, *texts):
+    """The plain substring semantics the matcher must reproduce."""
+    return [kw for kw in keywords if any(kw.lower() in text.lower() for text in texts)]
+
+
+def test_prefix_keywords_are_all_reported():
+    """A hit on "confirmed dead" also credits the shorter "confirmed"."""
+    matcher = _KeywordMatcher(["confirmed"], ["confirmed dead"])
+
+    assert matcher.find("Two confirmed dead after storm") == [["confirmed"], ["confirmed dead"]]
+    assert matcher.find("Reports confirmed by officials") == [["confirmed"], []]
+
+
+def test_keywords_match_as_substrings_not_words():
+    """Like the old `kw in text` check, word boundaries are not required."""
+    matcher = _KeywordMatcher(["sec", "just in"], ["war"])
+
+    assert matcher.find("Second award announced") == [["sec"], ["war"]]
+    # A keyword with a space still needs the space
+    assert matcher.find("Justin explains") == [[], []]
+    # Keywords do not match across separate texts
+    assert matcher.find("news just", "in time") == [[], []]
+
+
+def test_matching_ignores_case_and_keeps_keyword_casing():
+    """Texts and keywords match in any casing; results use the list's casing."""
+    matcher = _KeywordMatcher(["Nobel", "fda approval"], ["BREAKING"])
+
+    assert matcher.find("nobel prize", "FDA Approval granted; Breaking") == [
+        ["Nobel", "fda approval"],
+        ["BREAKING"],
+    ]
+
+
+def test_domain_matchers_agree_with_substring_search():
+    """Randomized texts built from keyword fragments match the old semantics."""
+    rng = random.Random(1234)
+    universal = BreakingNewsDetector.UNIVERSAL_KEYWORDS
+    for domain, keywords in BreakingNewsDetector.BREAKING_KEYWORDS.items():
+        vocabulary = keywords + universal + ["the", "dead", "in", "x", " "]
+        for _ in range(200):
+            texts = [
+                "".join(
+                    rng.choice(vocabulary)[: rng.randint(1, 12)].swapcase()
+                    if rng.random() < 0.3 else rng.choice(vocabulary)
+                    for _ in range(rng.randint(0, 6))
+                )
+                for _ in range(2)
+            ]
+            assert _DOMAIN_MATCHERS[domain].find(*texts) == [
+                substring_hits(keywords, *texts),
+                substring_hits(universal, *texts),
+            ], texts
@@ -43,7 +43,7 @@ async def run_e2e_test():
     
     # Step 2: Save papers to DB
     print("\n[STEP 2] Saving papers to database...")
-    from app.models.paper import Paper, Author
+    from app.models.paper import Paper
     
     paper_ids = []
     async with async_session_maker() as session:
@@ -59,9 +59,10 @@ async def run_e2e_test():
                 published_date=pd.published_date,
                 is_preprint=pd.is_preprint,
             )
-            for author_data in pd.authors[:5]:
-                author = Author(name=author_data.name, affiliation=author_data.affiliation)
-                paper.authors.append(author)
+            paper.authors = [
+                {"name": author_data.name, "affiliation": author_data.affiliation}
+                for author_data in pd.authors[:5]
+            ]
             session.add(paper)
             await session.commit()
             await session.refresh(paper)
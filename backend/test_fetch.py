@@ -50,15 +50,14 @@ async def main():
 
         # List papers in database
         print("\nPapers in database:")
-        from sqlalchemy.orm import selectinload
         result = await session.execute(
-            select(Paper).options(selectinload(Paper.authors)).limit(5)
+            select(Paper).limit(5)
         )
         papers = result.scalars().all()
 
         for i, paper in enumerate(papers, 1):
             print(f"{i}. [{paper.source}] {paper.title[:60]}...")
-            author_names = [a.name for a in paper.authors[:3]]
+            author_names = [a["name"] for a in (paper.authors or [])[:3]]
             if author_names:
                 print(f"   Authors: {', '.join(author_names)}")
             print(f"   Published: {paper.published_date}")
@@ -0,0 +1,55 @@
+"""Fetch pipeline storage tests against a throwaway SQLite database."""
+import asyncio
+
+from sqlalchemy import select
+
+from app.fetchers.base import PaperData
+from app.models.paper import Paper
+from app.services.fetch_service import FetchService, SourceFetchResult
+
+
+class RacingFetchService(FetchService):
+    """Misses stored papers on its first lookup, as if another fetch had
+    stored them between the lookup and the INSERT."""
+
+    lookups = 0
+
+    async def _find_existing_papers(self, batch):
+        self.lookups += 1
+        if self.lookups == 1:
+            return {}, {}
+        return await super()._find_existing_papers(batch)
+
+
+def test_store_batch_applies_papers_skipped_by_insert_as_updates(session_maker):
+    """A paper the INSERT skips on conflict is counted and stored as updated."""
+
+    async def run():
+        async with session_maker() as db:
+            db.add(Paper(title="Shared paper", source="other", source_id="1", doi="10.1000/shared"))
+            await db.commit()
+
+        batch = [
+            PaperData(
+                title="Shared paper", abstract=None, authors=[],
+                source="test", source_id="a", doi="10.1000/shared", citations=5,
+            ),
+            PaperData(
+                title="Fresh paper", abstract=None, authors=[],
+                source="test", source_id="b", doi="10.1000/fresh",
+            ),
+        ]
+        result = SourceFetchResult(fetched=len(batch))
+
+        async with session_maker() as db:
+            service = RacingFetchService(db)
+            await service._store_batch(batch, result)
+            await asyncio.gather(*service._notify_tasks)
+
+        assert (result.new, result.updated) == (1, 1)
+
+        async with session_maker() as db:
+            shared = await db.scalar(select(Paper).where(Paper.doi == "10.1000/shared"))
+        assert shared.citations == 5
+
+    asyncio.run(run())
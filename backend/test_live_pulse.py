@@ -0,0 +1,38 @@
+"""Live Pulse service tests against a throwaway SQLite database."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.models.paper import Paper
+from app.services.live_pulse_service import LivePulseService
+
+
+def test_refresh_breaking_scores_spans_several_batches(session_maker):
+    """Refreshing a window larger than batch_size scores every paper."""
+
+    async def run():
+        now = datetime.now(timezone.utc)
+        async with session_maker() as db:
+            db.add_all([
+                Paper(
+                    title=f"BREAKING: Test story number {i}",
+                    source="test",
+                    source_id=str(i),
+                    fetched_at=now - timedelta(minutes=i),
+                )
+                for i in range(127)
+            ])
+            await db.commit()
+
+        async with session_maker() as db:
+            stats = await LivePulseService(db).refresh_breaking_scores(batch_size=100)
+        assert stats["papers_updated"] == 127
+
+        async with session_maker() as db:
+            scored = await db.scalar(
+                select(func.count()).where(Paper.freshness_score.is_not(None))
+            )
+        assert scored == 127
+
+    asyncio.run(run())
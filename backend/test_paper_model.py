@@ -0,0 +1,48 @@
+"""Paper bulk write tests against a throwaway SQLite database."""
+import asyncio
+
+from sqlalchemy import select
+
+from app.models.paper import Paper
+
+
+def test_bulk_upsert_updates_preprint_that_gained_a_doi(session_maker):
+    """A stored paper matched by (source, source_id) takes the new DOI."""
+
+    async def run():
+        async with session_maker() as db:
+            [paper_id] = await Paper.bulk_upsert(db, [
+                {"title": "Preprint", "source": "arxiv", "source_id": "2401.1"},
+            ])
+            await db.commit()
+
+        async with session_maker() as db:
+            [updated_id] = await Paper.bulk_upsert(db, [
+                {"title": "Published", "source": "arxiv", "source_id": "2401.1", "doi": "10.1000/a"},
+            ])
+            await db.commit()
+            papers = list(await db.scalars(select(Paper)))
+
+        assert updated_id == paper_id
+        assert [(p.title, p.doi) for p in papers] == [("Published", "10.1000/a")]
+
+    asyncio.run(run())
+
+
+def test_bulk_upsert_dedupes_conflict_keys_within_a_batch(session_maker):
+    """Rows repeating a DOI or source ID in one call collapse to the last one."""
+
+    async def run():
+        async with session_maker() as db:
+            await Paper.bulk_upsert(db, [
+                {"title": "First", "source": "pubmed", "source_id": "1", "doi": "10.1000/b"},
+                {"title": "Second", "source": "crossref", "source_id": "x", "doi": "10.1000/b"},
+                {"title": "Draft", "source": "arxiv", "source_id": "2", "doi": None},
+                {"title": "Final", "source": "arxiv", "source_id": "2", "doi": None},
+            ])
+            await db.commit()
+            papers = list(await db.scalars(select(Paper).order_by(Paper.title)))
+
+        assert [p.title for p in papers] == ["Final", "Second"]
+
+    asyncio.run(run())
@@ -9,7 +9,7 @@ sys.path.append(os.getcwd())
 
 from app.composers.pdf_composer import PDFComposer
 from app.models.digest import Digest, DigestPaper
-from app.models.paper import Paper, Author
+from app.models.paper import Paper
 
 async def test_pdf():
     # Mock data
@@ -21,7 +21,7 @@ async def test_pdf():
         summary_takeaway="People should read this.",
         summary_why_matters="It changes everything.",
         credibility_score=85,
-        authors=[Author(name="John Doe")],
+        authors=[{"name": "John Doe"}],
         published_date="2024-01-01"
     )
     
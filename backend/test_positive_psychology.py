@@ -55,7 +55,7 @@ async def run_positive_psychology_test():
     print("STEP 2: SAVING PAPERS TO DATABASE")
     print("=" * 70)
     
-    from app.models.paper import Paper, Author
+    from app.models.paper import Paper
     
     paper_ids = []
     async with async_session_maker() as session:
@@ -72,8 +72,10 @@ async def run_positive_psychology_test():
                 is_preprint=pd.is_preprint,
                 is_peer_reviewed=pd.is_peer_reviewed,
             )
-            for author in pd.authors[:5]:
-                paper.authors.append(Author(name=author.name, affiliation=author.affiliation))
+            paper.authors = [
+                {"name": author.name, "affiliation": author.affiliation}
+                for author in pd.authors[:5]
+            ]
             session.add(paper)
             await session.commit()
             await session.refresh(paper)
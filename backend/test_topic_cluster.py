@@ -0,0 +1,17 @@
+"""Topic cluster model tests against a throwaway SQLite database."""
+import asyncio
+
+from app.models.topic_cluster import TopicCluster
+
+
+def test_repr_after_save_does_not_load_paper_count(session_maker):
+    """repr() of a freshly saved cluster works without a lazy load."""
+
+    async def run():
+        async with session_maker() as db:
+            cluster = TopicCluster(name="AI safety")
+            db.add(cluster)
+            await db.commit()
+            assert repr(cluster) == f"<TopicCluster(id={cluster.id}, name='AI safety')>"
+
+    asyncio.run(run())
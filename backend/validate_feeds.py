@@ -50,7 +50,9 @@ async def test_validation_logic():
             authors=[]
         )
         
-        paper1 = await fetch_service._create_paper(paper_data)
+        await fetch_service._load_custom_sources()
+        [paper1] = await fetch_service._create_papers([paper_data])
+        await session.commit()
         print(f"Paper 1 validated: {paper1.is_validated_source}")
         assert not paper1.is_validated_source, "Paper should not be validated yet"
         
@@ -69,7 +71,9 @@ async def test_validation_logic():
             authors=[]
         )
         
-        paper2 = await fetch_service._create_paper(paper_data2)
+        await fetch_service._load_custom_sources()
+        [paper2] = await fetch_service._create_papers([paper_data2])
+        await session.commit()
         print(f"Paper 2 validated: {paper2.is_validated_source}")
         assert paper2.is_validated_source, "Paper should be validated now"
         